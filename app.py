@@ -30,6 +30,20 @@ except ImportError:
 
 app = Flask(__name__)
 
+# Per-route latency budgets in ms (None = unbounded); override per request with ?deadline_ms=
+# Historical result updates that do not fit the budget run in the background, not inline
+ROUTE_DEADLINES_MS = {
+    'real-games-predictions': 1000,
+    'games-predictions': 1000
+}
+
+def get_route_deadline_ms(route_name: str):
+    """Deadline for a route, overridable with ?deadline_ms= (0 disables it)"""
+    deadline_ms = request.args.get('deadline_ms', type=float)
+    if deadline_ms is None:
+        return ROUTE_DEADLINES_MS.get(route_name)
+    return deadline_ms if deadline_ms > 0 else None
+
 # Initialize prediction engine
 prediction_engine = None
 if ULTRA_FAST_AVAILABLE:
@@ -856,12 +870,11 @@ def get_real_games_predictions():
             else:
                 games_source = 'ProjectedStarters.json - Real MLB games'
             
-            predictions = []
             start_time = datetime.now()
             
-            for away, home in real_games:
-                prediction = engine.get_fast_prediction(away, home, sim_count=1500)
-                predictions.append(prediction)
+            # Whole slate in one batched simulation
+            predictions = engine.get_slate_predictions(real_games, sim_count=1500,
+                                                       deadline_ms=get_route_deadline_ms('real-games-predictions'))
             
             total_time = (datetime.now() - start_time).total_seconds() * 1000
             
@@ -935,13 +948,11 @@ def get_games_predictions():
                     'suggestion': 'August 8, 2025 has complete accuracy validation data with 15 games showing predicted vs actual results.'
                 })
             
-            predictions = []
             start_time = datetime.now()
             
-            for away, home in real_games:
-                # Pass the game_date to enable historical lookup
-                prediction = engine.get_fast_prediction(away, home, sim_count=1500, game_date=game_date)
-                predictions.append(prediction)
+            # Pass the game_date to enable historical lookup; live games share one batched simulation
+            predictions = engine.get_slate_predictions(real_games, sim_count=1500, game_date=game_date,
+                                                       deadline_ms=get_route_deadline_ms('games-predictions'))
             
             total_time = (datetime.now() - start_time).total_seconds() * 1000
             
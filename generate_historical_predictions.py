@@ -5,44 +5,11 @@ Create predictions for all real games we have actual results for
 """
 
 import json
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime
-from ultra_fast_engine import FastPredictionEngine
-
-def _convert_to_short_name(full_name: str) -> str:
-    """Convert full team names back to short names"""
-    name_mapping = {
-        'Los Angeles Angels': 'Angels',
-        'Houston Astros': 'Astros', 
-        'Oakland Athletics': 'Athletics',
-        'Toronto Blue Jays': 'Blue Jays',
-        'Cleveland Guardians': 'Guardians',
-        'Seattle Mariners': 'Mariners',
-        'Baltimore Orioles': 'Orioles',
-        'Texas Rangers': 'Rangers',
-        'Tampa Bay Rays': 'Rays',
-        'Boston Red Sox': 'Red Sox',
-        'Kansas City Royals': 'Royals',
-        'Detroit Tigers': 'Tigers',
-        'Minnesota Twins': 'Twins',
-        'Chicago White Sox': 'White Sox',
-        'New York Yankees': 'Yankees',
-        'Atlanta Braves': 'Braves',
-        'Milwaukee Brewers': 'Brewers',
-        'St. Louis Cardinals': 'Cardinals',
-        'Chicago Cubs': 'Cubs',
-        'Arizona Diamondbacks': 'Diamondbacks',
-        'Los Angeles Dodgers': 'Dodgers',
-        'San Francisco Giants': 'Giants',
-        'Miami Marlins': 'Marlins',
-        'New York Mets': 'Mets',
-        'Washington Nationals': 'Nationals',
-        'San Diego Padres': 'Padres',
-        'Philadelphia Phillies': 'Phillies',
-        'Pittsburgh Pirates': 'Pirates',
-        'Cincinnati Reds': 'Reds',
-        'Colorado Rockies': 'Rockies'
-    }
-    return name_mapping.get(full_name, full_name)
+from ultra_fast_engine import FastPredictionEngine, PARALLEL_TASK_SIMS
+from team_registry import to_short_name
 
 def generate_historical_predictions():
     """Generate predictions for all historical games with real results"""
@@ -54,9 +21,11 @@ def generate_historical_predictions():
         with open(cache_file, 'r') as f:
             data = json.load(f)
         
-        engine = FastPredictionEngine()
         total_predictions_added = 0
         
+        engine = FastPredictionEngine()
+        sim_count = 2000
+        
         # Process each date
         for date, date_data in data.items():
             if 'cached_predictions' not in date_data:
@@ -64,9 +33,9 @@ def generate_historical_predictions():
             
             print(f"\\n📅 Processing {date}...")
             
-            # Process each game
+            # Collect games that have actual results but no predictions
+            pending_games = []
             for game_key, game_data in date_data['cached_predictions'].items():
-                # Only generate predictions for games that have actual results but no predictions
                 if (game_data.get('has_real_results', False) and 
                     'actual_away_score' in game_data and 
                     'actual_home_score' in game_data and
@@ -77,44 +46,62 @@ def generate_historical_predictions():
                         away_team, home_team = game_key.split(' @ ')
                         
                         # Convert full names to short names for engine
-                        away_short = _convert_to_short_name(away_team)
-                        home_short = _convert_to_short_name(home_team)
+                        away_short = to_short_name(away_team)
+                        home_short = to_short_name(home_team)
                         
                         print(f"🎯 Generating prediction for {game_key}")
                         print(f"   Teams: {away_team} ({away_short}) @ {home_team} ({home_short})")
+                        pending_games.append((game_key, away_short, home_short))
+            
+            if not pending_games:
+                continue
+            
+            # One batched request per date; a process pool only pays off once the slate
+            # outgrows one executor task
+            use_pool = len(pending_games) * sim_count > PARALLEL_TASK_SIMS
+            with (ProcessPoolExecutor() if use_pool else nullcontext()) as executor:
+                engine.set_executor(executor)
+                try:
+                    predictions = engine.get_slate_predictions(
+                        [(away, home) for _, away, home in pending_games], sim_count=sim_count, game_date=date)
+                except Exception as e:
+                    # One bad game should not cost the whole date - retry game by game
+                    print(f"   ⚠️ Slate prediction failed for {date} ({e}) - retrying game by game")
+                    predictions = [_predict_game(engine, away, home, date, sim_count)
+                                   for _, away, home in pending_games]
+                engine.set_executor(None)
+            
+            for (game_key, _, _), prediction in zip(pending_games, predictions):
+                try:
+                    game_data = date_data['cached_predictions'][game_key]
+                    
+                    if prediction and 'predictions' in prediction:
+                        pred_away = prediction['predictions']['predicted_away_score']
+                        pred_home = prediction['predictions']['predicted_home_score']
+                        pred_total = prediction['predictions']['predicted_total_runs']
+                        
+                        # Add prediction data to game
+                        game_data.update({
+                            'predicted_away_score': pred_away,
+                            'predicted_home_score': pred_home,
+                            'predicted_total_runs': pred_total,
+                            'prediction_error_away': abs(pred_away - game_data['actual_away_score']),
+                            'prediction_error_home': abs(pred_home - game_data['actual_home_score']),
+                            'prediction_error_total': abs(pred_total - game_data['actual_total_score']),
+                            'winner_predicted_correctly': _check_winner_prediction(
+                                pred_away, pred_home, 
+                                game_data['actual_away_score'], 
+                                game_data['actual_home_score']
+                            ),
+                            'prediction_generated_timestamp': datetime.now().isoformat()
+                        })
                         
-                        try:
-                            # Generate prediction
-                            prediction = engine.get_fast_prediction(away_short, home_short, game_date=date)
-                            
-                            if prediction and 'predictions' in prediction:
-                                pred_away = prediction['predictions']['predicted_away_score']
-                                pred_home = prediction['predictions']['predicted_home_score']
-                                pred_total = prediction['predictions']['predicted_total_runs']
-                                
-                                # Add prediction data to game
-                                game_data.update({
-                                    'predicted_away_score': pred_away,
-                                    'predicted_home_score': pred_home,
-                                    'predicted_total_runs': pred_total,
-                                    'prediction_error_away': abs(pred_away - game_data['actual_away_score']),
-                                    'prediction_error_home': abs(pred_home - game_data['actual_home_score']),
-                                    'prediction_error_total': abs(pred_total - game_data['actual_total_score']),
-                                    'winner_predicted_correctly': _check_winner_prediction(
-                                        pred_away, pred_home, 
-                                        game_data['actual_away_score'], 
-                                        game_data['actual_home_score']
-                                    ),
-                                    'prediction_generated_timestamp': datetime.now().isoformat()
-                                })
-                                
-                                print(f"   ✅ Predicted: {pred_away:.1f}-{pred_home:.1f} vs Actual: {game_data['actual_away_score']}-{game_data['actual_home_score']}")
-                                total_predictions_added += 1
-                            else:
-                                print(f"   ❌ Could not generate prediction")
-                                
-                        except Exception as e:
-                            print(f"   ❌ Error generating prediction: {e}")
+                        print(f"   ✅ {game_key} predicted: {pred_away:.1f}-{pred_home:.1f} vs Actual: {game_data['actual_away_score']}-{game_data['actual_home_score']}")
+                        total_predictions_added += 1
+                    else:
+                        print(f"   ❌ Could not generate prediction for {game_key}")
+                except Exception as e:
+                    print(f"   ❌ Error generating prediction for {game_key}: {e}")
         
         # Save updated data
         with open(cache_file, 'w') as f:
@@ -127,6 +114,15 @@ def generate_historical_predictions():
         print(f"❌ Error generating predictions: {e}")
         return 0
 
+def _predict_game(engine: FastPredictionEngine, away_team: str, home_team: str,
+                  game_date: str, sim_count: int):
+    """Single-game prediction (None on error)"""
+    try:
+        return engine.get_fast_prediction(away_team, home_team, sim_count=sim_count, game_date=game_date)
+    except Exception as e:
+        print(f"   ❌ Error generating prediction for {away_team} @ {home_team}: {e}")
+        return None
+
 def _check_winner_prediction(pred_away: float, pred_home: float, actual_away: int, actual_home: int) -> bool:
     """Check if we predicted the winner correctly"""
     predicted_winner = 'home' if pred_home > pred_away else 'away'
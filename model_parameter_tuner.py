@@ -5,6 +5,7 @@ Apply recommendations from performance analysis to improve prediction accuracy
 """
 
 import json
+import os
 import shutil
 from datetime import datetime
 from typing import Dict, List
@@ -85,6 +86,26 @@ class ModelParameterTuner:
         print(f"📊 Applied variance adjustment: 0.20 → {new_chaos}")
         return new_content
     
+    def apply_dispersion_adjustment(self, content: str, new_shape: float) -> str:
+        """Adjust the gamma-mixed Poisson dispersion_shape parameter"""
+        pattern = r'(dispersion_shape\s*=\s*)([0-9]*\.?[0-9]+)'
+        new_content = re.sub(pattern, lambda m: f"{m.group(1)}{new_shape}", content)
+        
+        print(f"🎲 Applied dispersion adjustment: shape → {new_shape}")
+        return new_content
+    
+    def apply_pitcher_curve_adjustment(self, curves: Dict) -> bool:
+        """Write refitted pitcher quality curve knots to pitcher_factor_curves.json (read by the engine at load)"""
+        curves_file = os.path.join(os.path.dirname(os.path.abspath(self.engine_file)), 'pitcher_factor_curves.json')
+        try:
+            with open(curves_file, 'w') as f:
+                json.dump(curves, f, indent=2)
+            print(f"⚾ Applied pitcher curve adjustment: {', '.join(sorted(curves))} → {curves_file}")
+            return True
+        except Exception as e:
+            print(f"❌ Error writing pitcher curves: {e}")
+            return False
+    
     def apply_home_field_adjustment(self, content: str, adjustment: float) -> str:
         """Adjust home field advantage if needed"""
         # Pattern to find home field advantage
@@ -127,6 +148,16 @@ class ModelParameterTuner:
             new_chaos = var_adj['suggested_chaos_factor_std']
             content = self.apply_variance_adjustment(content, new_chaos)
         
+        # Apply dispersion adjustment (gamma-mixed Poisson scoring model)
+        disp_adj = recommendations.get('dispersion_adjustment', {})
+        if 'suggested_dispersion_shape' in disp_adj:
+            content = self.apply_dispersion_adjustment(content, disp_adj['suggested_dispersion_shape'])
+        
+        # Pitcher quality curves live in a data file - no engine code edits needed
+        curve_adj = recommendations.get('pitcher_factor_curves', {})
+        if 'suggested_curves' in curve_adj:
+            self.apply_pitcher_curve_adjustment(curve_adj['suggested_curves'])
+        
         # Apply home field adjustment if significant
         hfa_adj = recommendations.get('home_field_advantage', {})
         net_advantage = hfa_adj.get('net_home_advantage', 0)
@@ -223,6 +254,14 @@ if __name__ == "__main__":
             new_chaos = var_adj['suggested_chaos_factor_std']
             print(f"🎲 Chaos factor: {old_chaos} → {new_chaos}")
         
+        disp_adj = recommendations.get('dispersion_adjustment', {})
+        if 'suggested_dispersion_shape' in disp_adj:
+            print(f"🎲 Dispersion shape: {disp_adj.get('current_dispersion_shape', 6.0)} → {disp_adj['suggested_dispersion_shape']}")
+        
+        curve_adj = recommendations.get('pitcher_factor_curves', {})
+        if 'suggested_curves' in curve_adj:
+            print(f"⚾ Pitcher curves: refitted {', '.join(sorted(curve_adj['suggested_curves']))}")
+        
         print(f"\\n💾 Backup created: {self.backup_file}")
         print(f"🧪 Test script: test_tuned_model.py")
         print(f"\\n🔄 Next steps:")
@@ -244,6 +283,10 @@ def main():
             'suggested_chaos_factor_std': 0.350,
             'variance_ratio': 2.03
         },
+        'dispersion_adjustment': {
+            'current_dispersion_shape': 6.0,
+            'suggested_dispersion_shape': 6.0
+        },
         'home_field_advantage': {
             'current_hfa': 0.15,
             'net_home_advantage': 0.2,
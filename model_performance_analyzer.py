@@ -153,7 +153,9 @@ class ModelPerformanceAnalyzer:
             'home_error': abs(predicted_home - actual_home),
             'winner_correct': winner_correct,
             'predicted_winner': predicted_winner,
-            'actual_winner': actual_winner
+            'actual_winner': actual_winner,
+            'away_pitcher': game_data.get('away_pitcher'),
+            'home_pitcher': game_data.get('home_pitcher')
         }
     
     def generate_tuning_recommendations(self, analysis: Dict) -> Dict:
@@ -161,6 +163,8 @@ class ModelPerformanceAnalyzer:
         recommendations = {
             'base_scoring_adjustment': {},
             'variance_adjustment': {},
+            'dispersion_adjustment': {},
+            'pitcher_factor_curves': {},
             'home_field_advantage': {},
             'pitcher_impact': {},
             'summary': []
@@ -203,6 +207,12 @@ class ModelPerformanceAnalyzer:
             'variance_ratio': round(variance_ratio, 2)
         }
         
+        # Gamma-mixed Poisson dispersion (method of moments on actual vs predicted totals)
+        recommendations['dispersion_adjustment'] = self._fit_dispersion_adjustment(analysis)
+        
+        # Pitcher quality curves refit from each starter's runs allowed vs predicted
+        recommendations['pitcher_factor_curves'] = self._fit_pitcher_curve_adjustment(analysis)
+        
         # Home field advantage analysis
         home_bias = analysis['individual_scores_analysis']['home_bias']
         away_bias = analysis['individual_scores_analysis']['away_bias']
@@ -245,6 +255,54 @@ class ModelPerformanceAnalyzer:
         
         return recommendations
     
+    def _load_sim_engine(self):
+        """Simulation engine for the model fits, loaded once (None when it can't be imported)"""
+        if not hasattr(self, '_sim_engine'):
+            try:
+                from ultra_fast_engine import UltraFastSimEngine
+                self._sim_engine = UltraFastSimEngine()
+            except ImportError as e:
+                print(f"⚠️ Skipping model fits - ultra-fast engine not available: {e}")
+                self._sim_engine = None
+        return self._sim_engine
+    
+    def _fit_dispersion_adjustment(self, analysis: Dict) -> Dict:
+        """Fit the gamma dispersion shape against the engine's current one (skipped if the engine can't load)"""
+        engine = self._load_sim_engine()
+        if engine is None:
+            return {}
+        
+        suggested_shape = engine.fit_dispersion_shape(
+            analysis['total_runs_analysis']['actual'], analysis['total_runs_analysis']['predicted'])
+        return {
+            'current_dispersion_shape': engine.dispersion_shape,
+            'suggested_dispersion_shape': round(suggested_shape, 2)
+        }
+    
+    def _fit_pitcher_curve_adjustment(self, analysis: Dict) -> Dict:
+        """Refit the pitcher quality curve knots; each starter is judged on the opposing lineup's runs"""
+        engine = self._load_sim_engine()
+        if engine is None:
+            return {}
+        
+        starters, ratios = [], []
+        for game in analysis['game_details']:
+            # Home starter faces the away lineup and vice versa
+            for pitcher, predicted, actual in ((game.get('home_pitcher'), game['predicted_away'], game['actual_away']),
+                                               (game.get('away_pitcher'), game['predicted_home'], game['actual_home'])):
+                if pitcher and predicted > 0:
+                    starters.append(pitcher)
+                    ratios.append(actual / predicted)
+        
+        suggested_curves = engine.fit_pitcher_factor_curves(starters, ratios)
+        if not suggested_curves:
+            return {}
+        return {
+            'starts_fitted': len(starters),
+            'current_curves': {stat: engine.pitcher_factor_curves[stat] for stat in suggested_curves},
+            'suggested_curves': suggested_curves
+        }
+    
     def print_analysis_report(self, analysis: Dict, recommendations: Dict):
         """Print comprehensive analysis report"""
         print("=" * 80)
@@ -293,6 +351,14 @@ class ModelPerformanceAnalyzer:
         var_adj = recommendations['variance_adjustment']
         print(f"   • Chaos factor std: {var_adj['current_chaos_factor_std']} → {var_adj['suggested_chaos_factor_std']}")
         
+        disp_adj = recommendations['dispersion_adjustment']
+        if 'suggested_dispersion_shape' in disp_adj:
+            print(f"   • Dispersion shape: {disp_adj['current_dispersion_shape']} → {disp_adj['suggested_dispersion_shape']}")
+        
+        curve_adj = recommendations['pitcher_factor_curves']
+        for stat, curve in curve_adj.get('suggested_curves', {}).items():
+            print(f"   • Pitcher {stat.upper()} curve: {curve_adj['current_curves'][stat]['values']} → {curve['values']}")
+        
         print(f"\n🎲 VARIANCE ANALYSIS:")
         print(f"   • Actual std dev: {var_adj['actual_std_dev']} runs")
         print(f"   • Predicted std dev: {var_adj['predicted_std_dev']} runs")
@@ -8,8 +8,12 @@ import requests
 import json
 import os
 import time
+import numpy as np
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+# Markets kept per game: (Odds-API market key, stored key); each is a two-outcome market
+MARKETS = (('h2h', 'moneyline'), ('spreads', 'runline'), ('totals', 'total'))
 
 class BettingLinesAutoUpdater:
     """Auto-updates MLB betting lines with intelligent caching and error handling"""
@@ -43,7 +47,9 @@ class BettingLinesAutoUpdater:
     def fetch_betting_lines_for_date(self, date_str: str) -> Dict:
         """
         Fetch betting lines for all MLB games for a given date using the Odds-API.
-        Returns a dict: { 'matchup_key': { 'moneyline': {...}, 'runline': {...}, 'total': {...} } }
+        Returns a dict: { 'matchup_key': { 'moneyline': {...}, 'runline': {...}, 'total': {...}, 'market': {...} } }
+        moneyline/runline/total hold the best price across every bookmaker in the response;
+        'market' keeps the per-book prices with consensus and no-vig fair odds
         """
         print(f"🎯 Fetching betting lines from Odds-API...")
         
@@ -58,56 +64,65 @@ class BettingLinesAutoUpdater:
         try:
             resp = requests.get(self.odds_api_url, params=params, timeout=20)
             resp.raise_for_status()
-            games = resp.json()
+            games = [game for game in resp.json() if game.get('home_team') and game.get('away_team')]
+            if not games:
+                # Off-days and early mornings: the API lists no games yet
+                print(f"✅ No games listed yet - no betting lines to fetch")
+                return {}
+            
+            # Every bookmaker's prices, stacked into (games x books x 2) arrays per market
+            book_keys = sorted({book['key'] for game in games for book in game.get('bookmakers', [])})
+            prices, points = self._stack_book_prices(games, book_keys)
+            market_summaries = {market: self.aggregate_market_prices(prices[market], points[market])
+                                for _, market in MARKETS}
             
             lines = {}
-            for game in games:
-                home = game.get('home_team')
-                away = game.get('away_team')
-                if not home or not away:
-                    continue
-                    
+            for g, game in enumerate(games):
+                home = game['home_team']
+                away = game['away_team']
                 matchup_key = f"{away}_at_{home}"
-                moneyline = None
-                runline = None
-                total = None
+                outcome_names = {'moneyline': [away, home], 'runline': [away, home], 'total': ['Over', 'Under']}
+                quoting_books = np.nonzero(np.isfinite(np.stack([prices[market][g] for _, market in MARKETS]))
+                                           .any(axis=(0, 2)))[0]
                 
-                # Each bookmaker has odds for h2h (moneyline), spreads (runline), totals (over/under)
-                # We'll use the first bookmaker's odds as representative
-                bookmakers = game.get('bookmakers', [])
-                if bookmakers:
-                    markets = {m['key']: m for m in bookmakers[0].get('markets', [])}
-                    
-                    # Moneyline (h2h)
-                    h2h = markets.get('h2h')
-                    if h2h and 'outcomes' in h2h:
-                        moneyline = {o['name']: o['price'] for o in h2h['outcomes']}
-                    
-                    # Runline (spreads)
-                    spreads = markets.get('spreads')
-                    if spreads and 'outcomes' in spreads:
-                        runline = [{
-                            'team': o['name'],
-                            'point': o.get('point'),
-                            'price': o.get('price')
-                        } for o in spreads['outcomes']]
-                    
-                    # Total (totals)
-                    totals = markets.get('totals')
-                    if totals and 'outcomes' in totals:
-                        total = [{
-                            'name': o['name'],
-                            'point': o.get('point'),
-                            'price': o.get('price')
-                        } for o in totals['outcomes']]
+                # Best available price at the consensus point (what the analyzer evaluates against)
+                summary = {market: self._game_market_summary(market_summaries[market], g, prices[market][g],
+                                                             points[market][g], quoting_books)
+                           for _, market in MARKETS}
+                for market_summary in filter(None, summary.values()):
+                    market_summary['best_book'] = [book_keys[book] for book in market_summary['best_book']]
+                moneyline = runline = total = None
+                if summary['moneyline']:
+                    moneyline = dict(zip(outcome_names['moneyline'], summary['moneyline']['best']))
+                if summary['runline']:
+                    runline = [{
+                        'team': name,
+                        'point': point,
+                        'price': price,
+                        'book': book
+                    } for name, point, price, book in zip(outcome_names['runline'], summary['runline']['points'],
+                                                           summary['runline']['best'], summary['runline']['best_book'])]
+                if summary['total']:
+                    total = [{
+                        'name': name,
+                        'point': point,
+                        'price': price,
+                        'book': book
+                    } for name, point, price, book in zip(outcome_names['total'], summary['total']['points'],
+                                                           summary['total']['best'], summary['total']['best_book'])]
                 
                 lines[matchup_key] = {
                     'moneyline': moneyline,
                     'runline': runline,
-                    'total': total
+                    'total': total,
+                    'market': {
+                        'bookmakers': [book_keys[book] for book in quoting_books.tolist()],
+                        **{market: dict(summary[market], outcomes=outcome_names[market])
+                           for _, market in MARKETS if summary[market]}
+                    }
                 }
             
-            print(f"✅ Successfully fetched betting lines for {len(lines)} games")
+            print(f"✅ Successfully fetched betting lines for {len(lines)} games from {len(book_keys)} bookmakers")
             return lines
             
         except requests.exceptions.RequestException as e:
@@ -117,6 +132,116 @@ class BettingLinesAutoUpdater:
             print(f"❌ Error processing betting lines: {e}")
             raise
     
+    def _stack_book_prices(self, games: List[Dict], book_keys: List[str]) -> Tuple[Dict, Dict]:
+        """
+        American prices and points per market as (games x books x 2) arrays, NaN where a book has no quote
+        Outcome order is [away, home] for moneyline/runline and [Over, Under] for totals
+        """
+        book_index = {key: b for b, key in enumerate(book_keys)}
+        shape = (len(games), len(book_keys), 2)
+        prices = {market: np.full(shape, np.nan) for _, market in MARKETS}
+        points = {market: np.full(shape, np.nan) for _, market in MARKETS}
+        
+        for g, game in enumerate(games):
+            outcome_slots = {game['away_team']: 0, game['home_team']: 1, 'Over': 0, 'Under': 1}
+            for book in game.get('bookmakers', []):
+                b = book_index[book['key']]
+                for api_market in book.get('markets', []):
+                    market = dict(MARKETS).get(api_market.get('key'))
+                    if market is None:
+                        continue
+                    for outcome in api_market.get('outcomes', []):
+                        slot = outcome_slots.get(outcome.get('name'))
+                        if slot is None or outcome.get('price') is None:
+                            continue
+                        prices[market][g, b, slot] = outcome['price']
+                        if outcome.get('point') is not None:
+                            points[market][g, b, slot] = outcome['point']
+        return prices, points
+    
+    @staticmethod
+    def aggregate_market_prices(prices: np.ndarray, points: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Best price, consensus price and no-vig fair odds for every game of one two-outcome market at once
+        prices/points are (games x books x 2); books are compared at each game's consensus point
+        (the first outcome's most-quoted point), so a -1.5 price never competes with a +1.5 one
+        With no books at all (games listed before any book posts odds) every game has 0 books
+        """
+        game_count = len(prices)
+        if prices.shape[1] == 0:
+            unpriced = np.full((game_count, 2), np.nan)
+            return {
+                'books': np.zeros(game_count, dtype=int),
+                'point': np.full(game_count, np.nan),
+                'best': unpriced,
+                'best_book': np.zeros((game_count, 2), dtype=int),
+                'consensus': unpriced.copy(),
+                'fair': unpriced.copy()
+            }
+        
+        # Consensus point: the first outcome's point quoted by the most books (moneylines have none)
+        first_points = points[:, :, 0]
+        has_points = np.isfinite(first_points).any(axis=1)
+        agreement = (first_points[:, :, None] == first_points[:, None, :]).sum(axis=2)
+        consensus_point = np.take_along_axis(first_points, agreement.argmax(axis=1)[:, None], axis=1)[:, 0]
+        at_point = np.where(has_points[:, None], first_points == consensus_point[:, None], True)
+        usable = at_point & np.isfinite(prices).all(axis=2)
+        
+        # Higher decimal odds pay more; books without a usable quote never win
+        decimal = np.where(prices > 0, 1 + prices / 100, 1 + 100 / np.abs(prices))
+        decimal = np.where(usable[:, :, None], decimal, -np.inf)
+        best_book = decimal.argmax(axis=1)
+        best = np.take_along_axis(prices, best_book[:, None, :], axis=1)[:, 0]
+        
+        # Consensus: mean implied probability across books; fair: the same after removing each book's vig
+        implied = np.where(usable[:, :, None], 1 / np.where(np.isfinite(decimal), decimal, 1.0), np.nan)
+        book_count = usable.sum(axis=1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            consensus_prob = np.nansum(implied, axis=1) / book_count[:, None]
+            fair_prob = np.nansum(implied / np.nansum(implied, axis=2, keepdims=True), axis=1) / book_count[:, None]
+        
+        return {
+            'books': book_count,
+            'point': np.where(has_points, consensus_point, np.nan),
+            'best': best,
+            'best_book': best_book,
+            'consensus': BettingLinesAutoUpdater._prob_to_american(consensus_prob),
+            'fair': BettingLinesAutoUpdater._prob_to_american(fair_prob)
+        }
+    
+    @staticmethod
+    def _prob_to_american(probs: np.ndarray) -> np.ndarray:
+        """American odds for probabilities (NaN stays NaN)"""
+        probs = np.clip(probs, 0.001, 0.999)
+        return np.round(np.where(probs >= 0.5, -100 * probs / (1 - probs), 100 * (1 - probs) / probs))
+    
+    @staticmethod
+    def _game_market_summary(aggregate: Dict[str, np.ndarray], g: int, game_prices: np.ndarray,
+                             game_points: np.ndarray, quoting_books: np.ndarray) -> Optional[Dict]:
+        """
+        JSON-ready row g of aggregate_market_prices plus the per-book arrays (None when no book quotes it)
+        prices/book_points rows follow the game's 'bookmakers' list
+        """
+        if aggregate['books'][g] == 0:
+            return None
+        best_book = aggregate['best_book'][g].tolist()
+        as_list = lambda values: [None if np.isnan(value) else value for value in values.tolist()]
+        summary = {
+            'books': int(aggregate['books'][g]),
+            'best': [int(price) for price in aggregate['best'][g].tolist()],
+            'best_book': best_book,
+            'consensus': [int(price) for price in aggregate['consensus'][g].tolist()],
+            'fair': [int(price) for price in aggregate['fair'][g].tolist()],
+            'prices': [[None if price is None else int(price) for price in as_list(row)]
+                       for row in game_prices[quoting_books]],
+            'points': None
+        }
+        if not np.isnan(aggregate['point'][g]):
+            # Each outcome's point at its best book (the second outcome mirrors the consensus point)
+            summary['points'] = [float(game_points[book, slot]) for slot, book in enumerate(best_book)]
+            summary['book_points'] = [as_list(row) for row in game_points[quoting_books]]
+        return summary
+    
     def load_existing_lines(self) -> Dict:
         """Load existing betting lines from JSON cache"""
         if os.path.exists(self.betting_lines_file):
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Engine throughput benchmark - flat Poisson path vs inning-by-inning path,
+compact (uint8 / float32) vs wide (int64 / float64) simulation buffers, and the variate pool
+"""
+
+import time
+import statistics
+import numpy as np
+from ultra_fast_engine import UltraFastSimEngine, STREAM_CHUNK_SIZE
+
+def benchmark(fn, repeats: int = 20):
+    """Median wall time (ms) of repeated calls after one warm-up call"""
+    fn()
+    times = []
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start_time) * 1000)
+    return statistics.median(times)
+
+def benchmark_session():
+    print("⏱️ ENGINE THROUGHPUT BENCHMARK")
+    print("=" * 50)
+
+    engine = UltraFastSimEngine()
+    games = [("Yankees", "Red Sox"), ("Dodgers", "Giants"), ("Astros", "Rangers"),
+             ("Cubs", "Cardinals"), ("Braves", "Mets")] * 3
+    game_date = "2025-08-09"
+
+    print(f"✓ Slate of {len(games)} games")
+
+    for sim_count in [500, 1500, 5000, 20000]:
+        flat_ms = benchmark(lambda: engine.simulate_slate(games, sim_count, game_date))
+        innings_ms = benchmark(lambda: engine.simulate_slate_innings(games, sim_count, game_date))
+        game_sims = sim_count * len(games)
+
+        print(f"\n⚡ {sim_count} sims per game:")
+        print(f"   Flat Poisson: {flat_ms:6.1f}ms ({game_sims / flat_ms / 1000:5.2f}M game-sims/s)")
+        print(f"   Innings:      {innings_ms:6.1f}ms ({game_sims / innings_ms / 1000:5.2f}M game-sims/s)")
+        print(f"   Innings cost: {innings_ms / flat_ms:.1f}x flat")
+
+    # Buffer dtypes - a second engine built with wide buffers
+    wide_engine = UltraFastSimEngine(score_dtype=np.int64, lambda_dtype=np.float64)
+    compact_dtypes = (engine.score_dtype, engine.lambda_dtype)
+    print(f"\n🗜️ BUFFER DTYPES (compact {compact_dtypes[0].__name__}/{compact_dtypes[1].__name__} "
+          f"vs wide int64/float64):")
+    for scoring_model in ('gamma_poisson', 'game_chaos'):
+        engine.scoring_model = wide_engine.scoring_model = scoring_model
+        for sim_count in [5000, 100000]:
+            compact_ms = benchmark(lambda: engine.simulate_slate(games, sim_count, game_date), repeats=7)
+            wide_ms = benchmark(lambda: wide_engine.simulate_slate(games, sim_count, game_date), repeats=7)
+            game_sims = sim_count * len(games)
+            print(f"   {scoring_model:13s} {sim_count:6d} sims: compact {compact_ms:6.1f}ms "
+                  f"({game_sims / compact_ms / 1000:5.2f}M/s) | wide {wide_ms:6.1f}ms "
+                  f"({game_sims / wide_ms / 1000:5.2f}M/s) | {wide_ms / compact_ms:.2f}x")
+    engine.scoring_model = 'gamma_poisson'
+
+    # Per-chunk buffer footprint: away + home scores and the per-sim mixing multipliers
+    chunk_cells = len(games) * STREAM_CHUNK_SIZE
+    compact_mb = chunk_cells * (2 * np.dtype(compact_dtypes[0]).itemsize + np.dtype(compact_dtypes[1]).itemsize) / 1e6
+    wide_mb = chunk_cells * (2 * 8 + 8) / 1e6
+    print(f"   Buffers per {STREAM_CHUNK_SIZE}-sim chunk: compact {compact_mb:.1f}MB | wide {wide_mb:.1f}MB")
+
+    # Pre-generated uniform pool - requests only inverse-CDF transform pooled variates
+    print(f"\n🎲 VARIATE POOL (background-refilled uniforms vs per-call Poisson sampling):")
+    for sim_count in [200, 1000, 5000]:
+        sampled_ms = benchmark(lambda: engine.simulate_slate(games, sim_count, game_date))
+        engine.enable_variate_pool()
+        try:
+            pooled_ms = benchmark(lambda: engine.simulate_slate(games, sim_count, game_date))
+        finally:
+            engine.disable_variate_pool()
+        print(f"   {sim_count:5d} sims: pooled {pooled_ms:6.2f}ms | sampled {sampled_ms:6.2f}ms | "
+              f"{sampled_ms / pooled_ms:.2f}x")
+
+    # Distribution check on one game - the innings path has no ties
+    print(f"\n📊 DISTRIBUTION CHECK (Yankees @ Red Sox, 100000 sims):")
+    flat, _ = engine.simulate_game_vectorized("Yankees", "Red Sox", 100000, game_date)
+    innings, _ = engine.simulate_game_innings("Yankees", "Red Sox", 100000, game_date)
+    for name, results in (("Flat Poisson", flat), ("Innings", innings)):
+        ties = (results.away_scores == results.home_scores).mean()
+        print(f"   {name:12s}: total {results.total_runs.mean():.2f} | "
+              f"home win {results.home_wins.mean():.1%} | ties {ties:.1%}")
+
+if __name__ == "__main__":
+    benchmark_session()
@@ -5,7 +5,8 @@ Final tuning and performance validation before git deployment
 
 import time
 import statistics
-from ultra_fast_engine import FastPredictionEngine
+from concurrent.futures import ProcessPoolExecutor
+from ultra_fast_engine import FastPredictionEngine, PARALLEL_TASK_SIMS
 
 def final_tuning_session():
     print("🎯 FINAL TUNING SESSION - August 9, 2025")
@@ -72,13 +73,23 @@ def final_tuning_session():
     
     # Test with optimal settings on all games
     print(f"\n🚀 FULL DEPLOYMENT TEST ({best_sim_count} sims):")
-    all_times = []
     all_totals = []
     pitcher_factors = []
     
-    for away, home in real_games:
-        pred = engine.get_fast_prediction(away, home, best_sim_count)
-        all_times.append(pred['meta']['execution_time_ms'])
+    # Independent games spread over every core - only once the slate outgrows one executor task,
+    # below that the pool start-up costs more than the in-process batch
+    # (a slate prediction's execution_time_ms runs from the slate start, so the call is timed once)
+    slate_start = time.perf_counter()
+    if len(real_games) * best_sim_count > PARALLEL_TASK_SIMS:
+        with ProcessPoolExecutor() as executor:
+            engine.set_executor(executor)
+            predictions = engine.get_slate_predictions(real_games, best_sim_count)
+            engine.set_executor(None)
+    else:
+        predictions = engine.get_slate_predictions(real_games, best_sim_count)
+    per_game_ms = (time.perf_counter() - slate_start) * 1000 / max(len(predictions), 1)
+    
+    for pred in predictions:
         all_totals.append(pred['predictions']['predicted_total_runs'])
         pitcher_factors.extend([
             pred['pitcher_quality']['away_pitcher_factor'],
@@ -86,7 +97,7 @@ def final_tuning_session():
         ])
     
     print(f"   📈 {len(real_games)} games processed")
-    print(f"   ⏱️  Average time: {statistics.mean(all_times):.1f}ms")
+    print(f"   ⏱️  Average time: {per_game_ms:.1f}ms per game (one slate call)")
     print(f"   ⚾ Average total runs: {statistics.mean(all_totals):.1f}")
     print(f"   🎯 Pitcher factor range: {min(pitcher_factors):.3f} - {max(pitcher_factors):.3f}")
     
@@ -109,7 +120,7 @@ def final_tuning_session():
     print(f"\n🎯 FINAL SYSTEM STATUS:")
     print(f"   ✅ Real game data: {len(real_games)} games loaded")
     print(f"   ✅ Pitcher impacts: Active ({len([f for f in pitcher_factors if f != 1.0])} non-default factors)")
-    print(f"   ✅ Performance: {statistics.mean(all_times):.1f}ms average")
+    print(f"   ✅ Performance: {per_game_ms:.1f}ms average per game")
     print(f"   ✅ Accuracy: Within {abs(our_avg_runs - mlb_avg_runs):.2f} runs of MLB average")
     print(f"   ✅ Consistency: Perfect (seed-based stabilization)")
     print(f"   ✅ Duplicates: Eliminated (single source of truth)")
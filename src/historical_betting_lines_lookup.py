@@ -11,6 +11,7 @@ import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from TodaysGames import get_games_for_date
+from team_registry import to_short_name
 
 class HistoricalBettingLinesLookup:
     """
@@ -59,47 +60,8 @@ class HistoricalBettingLinesLookup:
     
     def _normalize_team_name(self, team_name: str) -> str:
         """Normalize team names for consistent matching"""
-        # Common team name variations
-        name_mappings = {
-            # Full names to common abbreviations
-            'Los Angeles Angels': 'Angels',
-            'Los Angeles Dodgers': 'Dodgers', 
-            'New York Yankees': 'Yankees',
-            'New York Mets': 'Mets',
-            'San Francisco Giants': 'Giants',
-            'Chicago Cubs': 'Cubs',
-            'Chicago White Sox': 'White Sox',
-            'St. Louis Cardinals': 'Cardinals',
-            'Boston Red Sox': 'Red Sox',
-            'Oakland Athletics': 'Athletics',
-            'Tampa Bay Rays': 'Rays',
-            'Kansas City Royals': 'Royals',
-            'Minnesota Twins': 'Twins',
-            'Houston Astros': 'Astros',
-            'Seattle Mariners': 'Mariners',
-            'Texas Rangers': 'Rangers',
-            'Cleveland Guardians': 'Guardians',
-            'Detroit Tigers': 'Tigers',
-            'Baltimore Orioles': 'Orioles',
-            'Toronto Blue Jays': 'Blue Jays',
-            'Atlanta Braves': 'Braves',
-            'Miami Marlins': 'Marlins',
-            'Philadelphia Phillies': 'Phillies',
-            'Washington Nationals': 'Nationals',
-            'Pittsburgh Pirates': 'Pirates',
-            'Cincinnati Reds': 'Reds',
-            'Milwaukee Brewers': 'Brewers',
-            'Arizona Diamondbacks': 'Diamondbacks',
-            'Colorado Rockies': 'Rockies',
-            'San Diego Padres': 'Padres'
-        }
-        
-        # Try direct mapping first
-        if team_name in name_mappings:
-            return name_mappings[team_name]
-        
-        # Return as-is if no mapping found
-        return team_name
+        # Canonical short name from the shared team registry
+        return to_short_name(team_name)
     
     def _find_matching_game(self, away_team: str, home_team: str, games_list: List[Dict]) -> Optional[Dict]:
         """Find matching game in games list with flexible team name matching"""
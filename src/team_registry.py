@@ -0,0 +1,72 @@
+"""
+MLB Team Registry
+Single source of truth for team names - resolves any alias (abbreviation, short name,
+full name, Odds-API name) to a small integer team ID once at the edge
+"""
+
+from typing import Dict, Optional
+
+# (abbreviation, short name, full name, extra aliases) - list position is the team ID
+_TEAMS = (
+    # American League
+    ('LAA', 'Angels', 'Los Angeles Angels', ('Anaheim Angels',)),
+    ('HOU', 'Astros', 'Houston Astros', ()),
+    ('OAK', 'Athletics', 'Oakland Athletics', ('ATH', "A's", 'Sacramento Athletics')),
+    ('TOR', 'Blue Jays', 'Toronto Blue Jays', ()),
+    ('CLE', 'Guardians', 'Cleveland Guardians', ('Indians', 'Cleveland Indians')),
+    ('SEA', 'Mariners', 'Seattle Mariners', ()),
+    ('BAL', 'Orioles', 'Baltimore Orioles', ()),
+    ('TEX', 'Rangers', 'Texas Rangers', ()),
+    ('TB', 'Rays', 'Tampa Bay Rays', ('TBR',)),
+    ('BOS', 'Red Sox', 'Boston Red Sox', ()),
+    ('KC', 'Royals', 'Kansas City Royals', ('KCR',)),
+    ('DET', 'Tigers', 'Detroit Tigers', ()),
+    ('MIN', 'Twins', 'Minnesota Twins', ()),
+    ('CWS', 'White Sox', 'Chicago White Sox', ('CHW',)),
+    ('NYY', 'Yankees', 'New York Yankees', ()),
+    # National League
+    ('ATL', 'Braves', 'Atlanta Braves', ()),
+    ('MIL', 'Brewers', 'Milwaukee Brewers', ()),
+    ('STL', 'Cardinals', 'St. Louis Cardinals', ('St Louis Cardinals',)),
+    ('CHC', 'Cubs', 'Chicago Cubs', ()),
+    ('ARI', 'Diamondbacks', 'Arizona Diamondbacks', ('AZ', 'D-backs')),
+    ('LAD', 'Dodgers', 'Los Angeles Dodgers', ()),
+    ('SF', 'Giants', 'San Francisco Giants', ('SFG',)),
+    ('MIA', 'Marlins', 'Miami Marlins', ()),
+    ('NYM', 'Mets', 'New York Mets', ()),
+    ('WSH', 'Nationals', 'Washington Nationals', ('WAS',)),
+    ('SD', 'Padres', 'San Diego Padres', ('SDP',)),
+    ('PHI', 'Phillies', 'Philadelphia Phillies', ()),
+    ('PIT', 'Pirates', 'Pittsburgh Pirates', ()),
+    ('CIN', 'Reds', 'Cincinnati Reds', ()),
+    ('COL', 'Rockies', 'Colorado Rockies', ()),
+)
+
+NUM_TEAMS = len(_TEAMS)
+TEAM_SHORT_NAMES = tuple(team[1] for team in _TEAMS)
+TEAM_FULL_NAMES = tuple(team[2] for team in _TEAMS)
+
+# Every alias, lower-cased, built once at import
+_ALIAS_TO_ID: Dict[str, int] = {}
+for _team_id, (_abbr, _short, _full, _extra) in enumerate(_TEAMS):
+    for _alias in (_abbr, _short, _full) + _extra:
+        _ALIAS_TO_ID[_alias.lower()] = _team_id
+
+
+def resolve_team_id(team_name: str) -> Optional[int]:
+    """Resolve any known alias to its team ID (None if unknown)"""
+    if not team_name:
+        return None
+    return _ALIAS_TO_ID.get(team_name.strip().lower())
+
+
+def to_short_name(team_name: str) -> str:
+    """Short name ('Yankees') for any alias; unknown names are returned unchanged"""
+    team_id = resolve_team_id(team_name)
+    return TEAM_SHORT_NAMES[team_id] if team_id is not None else team_name
+
+
+def to_full_name(team_name: str) -> str:
+    """Full name ('New York Yankees', as used by betting lines) for any alias"""
+    team_id = resolve_team_id(team_name)
+    return TEAM_FULL_NAMES[team_id] if team_id is not None else team_name
@@ -4,13 +4,114 @@ Optimized for speed while maintaining predictive accuracy with pitcher quality i
 """
 
 import numpy as np
-import random
+import hashlib
+import math
+import time
+import functools
+import threading
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
+from concurrent.futures import Executor
 import json
 import os
 from datetime import datetime, date
 from historical_betting_lines_lookup import HistoricalBettingLinesLookup
+from team_registry import NUM_TEAMS, TEAM_SHORT_NAMES, resolve_team_id, to_short_name, to_full_name
+
+# Scores are clipped to the max observed MLB team score, so every batch fits a 25x25 grid
+MAX_TEAM_RUNS = 24
+SCORE_BINS = MAX_TEAM_RUNS + 1
+
+# Pre-computed grid indices (rows = away score, columns = home score)
+_AWAY_GRID, _HOME_GRID = np.indices((SCORE_BINS, SCORE_BINS))
+_TOTAL_GRID = (_AWAY_GRID + _HOME_GRID).ravel()
+_DIFF_GRID = (_HOME_GRID - _AWAY_GRID + MAX_TEAM_RUNS).ravel()
+# [away, home, 1] per grid cell - bet margins are linear in the two scores
+_SETTLEMENT_BASIS = np.stack((_AWAY_GRID.ravel(), _HOME_GRID.ravel(), np.ones(SCORE_BINS * SCORE_BINS)))
+
+# 'simulation' samples Monte Carlo draws; 'analytic' computes the exact distribution;
+# 'adaptive' samples in blocks until the standard errors reach a tolerance;
+# 'innings' simulates half-innings (bottom-of-9th skips, walk-offs, ghost-runner extras)
+PREDICTION_MODES = ('simulation', 'analytic', 'adaptive', 'innings')
+
+# Inning model: regulation length, innings covered by the starter (also the F5 market),
+# the extra expected runs from the runner on second in extras, and per-inning run bins (last = 9+)
+INNINGS = 9
+STARTER_INNINGS = 5
+GHOST_RUNNER_EXTRA_RUNS = 0.6
+INNING_RUN_BINS = 10
+
+# Adaptive stopping rule: standard-error targets (win probability, runs), checked after every
+# block of sims. Under the gamma-Poisson spread a game total's std dev is ~3.5-6 runs, so 0.25 runs
+# takes ~200-550 sims depending on the game (0.15 needed ~900 for every game)
+ADAPTIVE_TOLERANCE = {'home_win_prob': 0.02, 'total_runs': 0.25}
+ADAPTIVE_BLOCK_SIZE = 100
+
+# Alternate totals ladder priced from the simulated total-runs distribution (whole lines can push)
+ALT_TOTAL_LINES = tuple(np.arange(5.5, 14.0, 0.5).tolist())
+
+# Run line (home -1.5 / +1.5) and alternate home spreads -4.5..+4.5, priced from the simulated margin
+ALT_SPREAD_LINES = tuple(np.arange(-4.5, 5.0, 1.0).tolist())
+
+# Slate portfolio sizing: simultaneous fractional Kelly over joint outcome scenarios drawn from each
+# game's histogram, with the total fraction of bankroll staked across the slate capped
+PORTFOLIO_SCENARIOS = 1000
+PORTFOLIO_MAX_EXPOSURE = 0.20
+PORTFOLIO_MAX_ITERATIONS = 300
+PORTFOLIO_TOLERANCE = 1e-5
+
+# Scoring models: 'game_chaos' scales a whole prediction by one clamped chaos factor;
+# 'gamma_poisson' draws a shared Gamma(k, 1/k) multiplier per simulation (overdispersed, correlated)
+SCORING_MODELS = ('game_chaos', 'gamma_poisson')
+
+# Opt-in variance reduction: independent replicate blocks per game (used to measure the error)
+VARIANCE_REDUCTION_METHODS = ('antithetic', 'stratified')
+VARIANCE_REDUCTION_BLOCKS = 10
+
+# Plain draws are generated in chunks of this many sims per game, so histogram-only paths
+# stream into running counts with constant memory (and match the in-memory draw exactly)
+STREAM_CHUNK_SIZE = 65536
+
+# Max sims per executor task when a pool backend is plugged in (larger requests are sharded)
+PARALLEL_TASK_SIMS = 250000
+
+# Compact buffers: scores never exceed MAX_TEAM_RUNS (uint8) and per-sim lambda/mixing buffers
+# need few significant digits (float32); histogram indices fit in uint16 (25 * 25 = 625 bins)
+# Defaults for UltraFastSimEngine(score_dtype=..., lambda_dtype=...)
+SCORE_DTYPE = np.uint8
+LAMBDA_DTYPE = np.float32
+
+# Optional variate pool: pre-generated uniforms in a ring of fixed-size blocks (64 x 16384 = 8MB)
+VARIATE_POOL_BLOCK_SIZE = 16384
+VARIATE_POOL_BLOCKS = 64
+
+# Pitcher quality curves: piecewise-linear in ERA, WHIP and innings pitched (np.interp, flat beyond
+# the end knots), knots at the midpoints of the old step ladders. pitcher_factor_curves.json
+# overrides any key, so the tuner can refit knots without code edits
+PITCHER_FACTOR_CURVES = {
+    'era': {'knots': [1.50, 2.375, 3.125, 3.875, 4.75, 5.875, 7.00],
+            'values': [0.60, 0.70, 0.85, 0.95, 1.15, 1.25, 1.40]},
+    'whip': {'knots': [0.90, 1.075, 1.225, 1.375, 1.55],
+             'values': [0.80, 0.90, 0.97, 1.08, 1.20]},
+    # Reliability: share of the ERA/WHIP adjustment applied for the sample size
+    'innings_pitched': {'knots': [25.0, 75.0, 125.0], 'values': [0.5, 0.8, 1.0]},
+    'era_weight': 0.70,  # WHIP gets the rest
+    'min_games_started': 5,
+    'bounds': [0.50, 1.60]
+}
+# Curve refits shrink knot values toward the current curves: roughly this many starts of evidence
+# around a knot are needed to move it halfway to what the starts alone would say
+PITCHER_CURVE_RIDGE = 5.0
+
+# Upper bound for a fitted gamma shape (effectively pure Poisson)
+MAX_DISPERSION_SHAPE = 1000.0
+
+# Deadline budgeting: starting cost estimates for the optional stages (refined from observed timings)
+# A historical results update that does not fit a request's budget (the 2000ms default never fits
+# the 1000ms routes) runs on a background thread instead, so the next request sees the results
+DEADLINE_STAGE_COSTS_MS = {'historical_auto_update': 2000.0, 'betting_lines': 5.0}
+DEADLINE_SIM_COST_MS = 0.0005  # per game per simulation
+DEADLINE_MIN_SIMS = 200
 
 @dataclass
 class FastGameResult:
@@ -20,13 +121,411 @@ class FastGameResult:
     home_wins: bool
     run_differential: int
 
+class SimulationResults:
+    """
+    Columnar simulation results backed by NumPy arrays
+    Rows are only materialized as FastGameResult views when indexed or iterated
+    """
+
+    def __init__(self, away_scores: np.ndarray, home_scores: np.ndarray):
+        self.away_scores = away_scores
+        self.home_scores = home_scores
+        self.total_runs = away_scores + home_scores
+        # Signed differential - compact unsigned scores would wrap on subtraction
+        self.run_differential = np.subtract(home_scores, away_scores, dtype=np.int16)
+        self.home_wins = home_scores > away_scores
+        # Refined estimates (e.g. control variates) that override the raw sample statistics
+        self.estimates = None
+
+    def __len__(self) -> int:
+        return len(self.away_scores)
+
+    def __getitem__(self, index: int) -> FastGameResult:
+        """Lazy per-row view for callers that still expect FastGameResult objects"""
+        return FastGameResult(
+            away_score=int(self.away_scores[index]),
+            home_score=int(self.home_scores[index]),
+            total_runs=int(self.total_runs[index]),
+            home_wins=bool(self.home_wins[index]),
+            run_differential=int(self.run_differential[index])
+        )
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def histogram(self) -> 'JointScoreHistogram':
+        """Reduce the batch to a joint away x home score histogram"""
+        histogram = JointScoreHistogram.from_scores(self.away_scores, self.home_scores)
+        histogram.estimates = self.estimates
+        return histogram
+
+class JointScoreHistogram:
+    """
+    Joint away x home score counts for a simulation batch (25x25)
+    Every summary statistic and market price is derived from this compact object
+    """
+
+    def __init__(self, counts: np.ndarray, exact: bool = False):
+        # exact=True means counts hold probabilities from a closed-form model, not sample counts
+        self.counts = counts
+        self.exact = exact
+        # Optional refined point estimates (variance reduction) - take precedence over the raw counts
+        self.estimates = None
+        # Optional first-five / per-inning market counts (innings mode)
+        self.inning_markets = None
+        # Variate pool offset the batch was drawn from (replay with variate_offset=...)
+        self.variate_offset = None
+
+    @classmethod
+    def from_scores(cls, away_scores: np.ndarray, home_scores: np.ndarray) -> 'JointScoreHistogram':
+        """Single np.bincount over the flattened (away, home) score index"""
+        flat_index = away_scores.astype(np.uint16) * SCORE_BINS + home_scores
+        counts = np.bincount(flat_index, minlength=SCORE_BINS * SCORE_BINS)
+        return cls(counts.reshape(SCORE_BINS, SCORE_BINS))
+
+    @classmethod
+    def batch_from_scores(cls, away_scores: np.ndarray,
+                          home_scores: np.ndarray) -> List['JointScoreHistogram']:
+        """One bincount for a (games x sims) score matrix, offset per game"""
+        return [cls(game_counts) for game_counts in cls.batch_counts(away_scores, home_scores)]
+
+    @staticmethod
+    def batch_counts(away_scores: np.ndarray, home_scores: np.ndarray) -> np.ndarray:
+        """
+        (games x 25 x 25) joint counts for a (games x sims) score matrix
+        The flat (away, home) index stays uint16 and each game row is counted straight into its histogram
+        """
+        game_count = away_scores.shape[0]
+        flat_index = away_scores.astype(np.uint16) * SCORE_BINS + home_scores.astype(np.uint16)
+        counts = np.empty((game_count, SCORE_BINS * SCORE_BINS), dtype=np.int64)
+        for game_counts, game_index in zip(counts, flat_index):
+            game_counts[:] = np.bincount(game_index, minlength=SCORE_BINS * SCORE_BINS)
+        return counts.reshape(game_count, SCORE_BINS, SCORE_BINS)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'JointScoreHistogram':
+        return cls(np.asarray(data['counts']).reshape(SCORE_BINS, SCORE_BINS), data.get('exact', False))
+
+    def to_dict(self) -> Dict:
+        """JSON-friendly form for caching"""
+        return {'counts': self.counts.ravel().tolist(), 'exact': self.exact}
+
+    def __add__(self, other: 'JointScoreHistogram') -> 'JointScoreHistogram':
+        return JointScoreHistogram(self.counts + other.counts, self.exact and other.exact)
+
+    @property
+    def sim_count(self):
+        return self.counts.sum()
+
+    # Marginal distributions (as counts over score values)
+    def away_counts(self) -> np.ndarray:
+        return self.counts.sum(axis=1)
+
+    def home_counts(self) -> np.ndarray:
+        return self.counts.sum(axis=0)
+
+    def total_runs_counts(self) -> np.ndarray:
+        """Counts for total runs 0..48"""
+        return np.bincount(_TOTAL_GRID, weights=self.counts.ravel(), minlength=2 * MAX_TEAM_RUNS + 1)
+
+    def total_line_probs(self, lines) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        (over, under, push) probabilities for any set of total lines from one cumulative sum
+        Whole-number lines push when the total lands exactly on them
+        """
+        total_pmf = self.total_runs_counts() / self.sim_count
+        total_cdf = np.cumsum(total_pmf)
+        lines = np.asarray(lines, dtype=float)
+        # Largest total strictly below each line
+        below = np.ceil(lines).astype(int) - 1
+        under = np.where(below >= 0, total_cdf[np.clip(below, 0, len(total_cdf) - 1)], 0.0)
+        whole = (lines == np.floor(lines)) & (lines >= 0) & (lines < len(total_pmf))
+        push = np.where(whole, total_pmf[np.clip(lines.astype(int), 0, len(total_pmf) - 1)], 0.0)
+        over = np.maximum(1.0 - under - push, 0.0)
+        return over, under, push
+
+    def run_differential_counts(self) -> np.ndarray:
+        """Counts for home - away run differential -24..24 (index 0 = -24)"""
+        return np.bincount(_DIFF_GRID, weights=self.counts.ravel(), minlength=2 * MAX_TEAM_RUNS + 1)
+
+    def spread_cover_probs(self, home_spreads) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        (home cover, away cover, push) probabilities for any set of home spreads from one cumulative sum
+        The home side covers when home - away + spread > 0; whole-number spreads push on the exact margin
+        """
+        diff_pmf = self.run_differential_counts() / self.sim_count
+        diff_cdf = np.cumsum(diff_pmf)
+        margins = -np.asarray(home_spreads, dtype=float) + MAX_TEAM_RUNS  # Cover threshold as a pmf index
+        # Largest margin strictly below each threshold
+        below = np.ceil(margins).astype(int) - 1
+        away = np.where(below >= 0, diff_cdf[np.clip(below, 0, len(diff_cdf) - 1)], 0.0)
+        whole = (margins == np.floor(margins)) & (margins >= 0) & (margins < len(diff_pmf))
+        push = np.where(whole, diff_pmf[np.clip(margins.astype(int), 0, len(diff_pmf) - 1)], 0.0)
+        home = np.maximum(1.0 - away - push, 0.0)
+        return home, away, push
+
+    # Summary statistics
+    @staticmethod
+    def _mean(counts: np.ndarray) -> float:
+        values = np.arange(len(counts))
+        return float(values @ counts / counts.sum())
+
+    @staticmethod
+    def _std(counts: np.ndarray) -> float:
+        values = np.arange(len(counts))
+        mean = values @ counts / counts.sum()
+        return float(np.sqrt(((values - mean) ** 2) @ counts / counts.sum()))
+
+    def _percentile(self, counts: np.ndarray, q: float) -> float:
+        """Same result as np.percentile (linear) on the underlying sample, without sorting it"""
+        cumulative = np.cumsum(counts)
+        if self.exact:
+            # Closed-form distribution: smallest value whose CDF reaches q
+            return float(np.searchsorted(cumulative, cumulative[-1] * q / 100.0 - 1e-12))
+        position = (cumulative[-1] - 1) * q / 100.0
+        lower = np.floor(position)
+        lower_value, upper_value = np.searchsorted(cumulative, [lower, np.ceil(position)], side='right')
+        return float(lower_value + (position - lower) * (upper_value - lower_value))
+
+    def mean_away(self) -> float:
+        if self.estimates:
+            return self.estimates['mean_away']
+        return self._mean(self.away_counts())
+
+    def mean_home(self) -> float:
+        if self.estimates:
+            return self.estimates['mean_home']
+        return self._mean(self.home_counts())
+
+    def mean_total(self) -> float:
+        if self.estimates:
+            return self.estimates['mean_away'] + self.estimates['mean_home']
+        return self._mean(self.total_runs_counts())
+
+    def std_total(self) -> float:
+        return self._std(self.total_runs_counts())
+
+    def home_win_prob(self) -> float:
+        """Home score strictly greater than away score (upper triangle)"""
+        if self.estimates:
+            return self.estimates['home_win_prob']
+        return float(np.triu(self.counts, k=1).sum() / self.sim_count)
+
+    def tie_prob(self) -> float:
+        return float(np.trace(self.counts) / self.sim_count)
+
+    def standard_errors(self) -> Dict[str, float]:
+        """Monte Carlo standard errors of home win prob and mean total (zero for exact)"""
+        if self.exact:
+            return {'home_win_prob': 0.0, 'total_runs': 0.0}
+        home_win_prob = float(np.triu(self.counts, k=1).sum() / self.sim_count)
+        return {
+            'home_win_prob': math.sqrt(home_win_prob * (1.0 - home_win_prob) / self.sim_count),
+            'total_runs': self.std_total() / math.sqrt(self.sim_count)
+        }
+
+    def away_range(self, low: float = 10, high: float = 90) -> Tuple[float, float]:
+        counts = self.away_counts()
+        return self._percentile(counts, low), self._percentile(counts, high)
+
+    def home_range(self, low: float = 10, high: float = 90) -> Tuple[float, float]:
+        counts = self.home_counts()
+        return self._percentile(counts, low), self._percentile(counts, high)
+
+    def total_runs_range(self, low: float = 10, high: float = 90) -> Tuple[float, float]:
+        counts = self.total_runs_counts()
+        return self._percentile(counts, low), self._percentile(counts, high)
+
+class PredictionBudget:
+    """
+    Wall-clock budget for one prediction request
+    Optional stages only run when their estimated cost fits; skipped or scaled stages are recorded
+    """
+
+    def __init__(self, deadline_ms: Optional[float] = None):
+        self.deadline_ms = deadline_ms
+        self.start = time.perf_counter()
+        self.degraded_stages = []
+
+    def remaining_ms(self) -> float:
+        if self.deadline_ms is None:
+            return float('inf')
+        return self.deadline_ms - (time.perf_counter() - self.start) * 1000
+
+    def allows(self, stage: str, estimated_ms: float, reserve_ms: float = 0.0) -> bool:
+        """True if the stage fits the remaining budget, otherwise records it as degraded"""
+        if self.remaining_ms() - reserve_ms >= estimated_ms:
+            return True
+        if stage not in self.degraded_stages:
+            self.degraded_stages.append(stage)
+        return False
+
+    def fit_sim_count(self, sim_count: int, cost_per_sim_ms: float, reserve_ms: float = 0.0) -> int:
+        """Largest sim count (down to DEADLINE_MIN_SIMS) whose estimated cost fits the budget"""
+        available_ms = self.remaining_ms() - reserve_ms
+        if available_ms >= sim_count * cost_per_sim_ms:
+            return sim_count
+        self.degraded_stages.append('simulation')
+        return max(DEADLINE_MIN_SIMS, int(available_ms / cost_per_sim_ms))
+
+class InningMarkets:
+    """
+    First-five-innings and per-inning market counts from an inning-by-inning batch
+    Prices F5 moneylines/totals and first-inning run (NRFI/YRFI) markets
+    """
+
+    def __init__(self, first_five_counts: np.ndarray, inning_run_counts: np.ndarray,
+                 scoreless_counts: np.ndarray):
+        self.first_five = JointScoreHistogram(first_five_counts)
+        # (2 x 9 x INNING_RUN_BINS) runs per half-inning: [0] = away (top), [1] = home (bottom)
+        self.inning_run_counts = inning_run_counts
+        # Sims with no run by either team, per inning
+        self.scoreless_counts = scoreless_counts
+
+    @property
+    def sim_count(self):
+        return self.first_five.sim_count
+
+    def scoreless_inning_prob(self, inning: int = 1) -> float:
+        """Probability neither team scores in the given inning (inning 1 = NRFI)"""
+        return float(self.scoreless_counts[inning - 1] / self.sim_count)
+
+    def inning_run_probs(self, inning: int) -> np.ndarray:
+        """(2 x INNING_RUN_BINS) away/home run distribution for one inning"""
+        return self.inning_run_counts[:, inning - 1] / self.sim_count
+
+    def summary(self) -> Dict:
+        """Market probabilities for the prediction response"""
+        first_five = self.first_five
+        nrfi_prob = self.scoreless_inning_prob(1)
+        return {
+            'first_five': {
+                'home_win_prob': round(first_five.home_win_prob(), 3),
+                'away_win_prob': round(float(np.tril(first_five.counts, k=-1).sum() / self.sim_count), 3),
+                'tie_prob': round(first_five.tie_prob(), 3),
+                'predicted_total_runs': round(first_five.mean_total(), 2),
+                'total_runs_range': first_five.total_runs_range()
+            },
+            'first_inning': {
+                'nrfi_prob': round(nrfi_prob, 3),
+                'yrfi_prob': round(1.0 - nrfi_prob, 3)
+            },
+            'scoreless_inning_probs': [round(float(p), 3) for p in self.scoreless_counts / self.sim_count]
+        }
+
+class VariatePool:
+    """
+    Ring buffer of pre-generated standard uniforms, refilled by a background thread
+    Block b of the stream is always default_rng([seed, b]).random(block_size), so any
+    (offset, count) slice can be replayed exactly, whatever the refill timing was
+    """
+
+    def __init__(self, seed: int = 0, block_size: int = VARIATE_POOL_BLOCK_SIZE,
+                 blocks: int = VARIATE_POOL_BLOCKS):
+        self.seed = seed
+        self.block_size = block_size
+        self.blocks = blocks
+        self._buffer = np.empty((blocks, block_size))
+        # Stream position of the next variate to hand out / the next block to generate;
+        # the ring holds blocks [read_offset // block_size, next_block)
+        self._read_offset = 0
+        self._next_block = 0
+        self._condition = threading.Condition()
+        self._closed = False
+        self._thread = None
+
+    def start(self) -> 'VariatePool':
+        """Start the background refill thread"""
+        if self._thread is None:
+            self._closed = False
+            self._thread = threading.Thread(target=self._refill, name='variate-pool', daemon=True)
+            self._thread.start()
+        return self
+
+    def close(self):
+        """Stop the refill thread (variates can still be taken, generated inline)"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    @property
+    def offset(self) -> int:
+        return self._read_offset
+
+    def buffered(self) -> int:
+        """Variates ready in the ring"""
+        with self._condition:
+            return self._next_block * self.block_size - self._read_offset
+
+    def _generate_block(self, block_index: int) -> np.ndarray:
+        return np.random.default_rng([self.seed, block_index]).random(self.block_size)
+
+    def _refill(self):
+        while True:
+            with self._condition:
+                while (not self._closed and
+                       self._next_block - self._read_offset // self.block_size >= self.blocks):
+                    self._condition.wait()
+                if self._closed:
+                    return
+                block_index = self._next_block
+            block = self._generate_block(block_index)
+            with self._condition:
+                # A consumer may have generated (or skipped past) this block inline meanwhile
+                if self._next_block == block_index:
+                    self._buffer[block_index % self.blocks] = block
+                    self._next_block += 1
+
+    def take(self, count: int) -> Tuple[int, np.ndarray]:
+        """
+        Next count uniforms and the stream offset they start at
+        Blocks the thread has not produced yet are generated inline, so a request never waits
+        """
+        with self._condition:
+            offset = self._read_offset
+            end = offset + count
+            first_block, last_block = offset // self.block_size, -(-end // self.block_size)
+            blocks = [self._buffer[block_index % self.blocks] if block_index < self._next_block
+                      else self._generate_block(block_index)
+                      for block_index in range(first_block, last_block)]
+            start = offset - first_block * self.block_size
+            variates = np.concatenate(blocks)[start:start + count] if blocks else np.empty(0)
+            if last_block > self._next_block:
+                # Keep a partially used last block in the ring for the next request
+                if end % self.block_size:
+                    self._buffer[(last_block - 1) % self.blocks] = blocks[-1]
+                self._next_block = last_block
+            self._read_offset = end
+            self._condition.notify_all()
+        return offset, variates
+
+    def variates(self, offset: int, count: int) -> np.ndarray:
+        """Regenerate the uniforms at (offset, count) of the stream - deterministic replay"""
+        first_block, last_block = offset // self.block_size, -(-(offset + count) // self.block_size)
+        blocks = [self._generate_block(block_index) for block_index in range(first_block, last_block)]
+        start = offset - first_block * self.block_size
+        return np.concatenate(blocks)[start:start + count] if blocks else np.empty(0)
+
 class UltraFastSimEngine:
     """
     Ultra-fast simulation engine using vectorized operations and pre-computed probabilities
     Now with pitcher quality integration for more realistic predictions
     """
     
-    def __init__(self):
+    def __init__(self, executor: Optional[Executor] = None,
+                 score_dtype: type = SCORE_DTYPE, lambda_dtype: type = LAMBDA_DTYPE):
+        # Optional concurrent.futures executor (e.g. ProcessPoolExecutor) for large offline jobs
+        self.executor = executor
+        # Simulation buffer dtypes (wide int64/float64 buffers are only used for benchmarking)
+        self.score_dtype = score_dtype
+        self.lambda_dtype = lambda_dtype
+        # Optional pre-generated uniform pool for low-latency online draws (enable_variate_pool)
+        self.variate_pool = None
+        
         # Pre-compute probability distributions for maximum speed
         self.setup_fast_distributions()
         
@@ -35,9 +534,61 @@ class UltraFastSimEngine:
         self.pitcher_stats = self._load_pitcher_stats()
         self.pitcher_id_map = self._load_pitcher_id_map()
         self.projected_starters = self._load_projected_starters()
+        self.pitcher_factor_curves = self._load_pitcher_factor_curves()
+        self.data_version = self._compute_data_version()
         
         # Cache common calculations
         self._setup_speed_cache()
+        self._build_pitcher_table()
+        self._build_pitcher_factor_index()
+        self._build_team_tables()
+    
+    def reload_data(self):
+        """Reload team/pitcher/starter data and rebuild every derived lookup table"""
+        self.team_strengths = self._load_team_strengths_fast()
+        self.pitcher_stats = self._load_pitcher_stats()
+        self.pitcher_id_map = self._load_pitcher_id_map()
+        self.projected_starters = self._load_projected_starters()
+        self.pitcher_factor_curves = self._load_pitcher_factor_curves()
+        self.data_version = self._compute_data_version()
+        self._build_pitcher_table()
+        self._build_pitcher_factor_index()
+        self._build_team_tables()
+    
+    def _build_team_tables(self):
+        """Team-ID indexed strength array and (away_id, home_id) -> starters index"""
+        # Strengths keep the exact-name lookup of the short names get_todays_real_games hands us
+        self.team_strength_array = np.array([self._team_strength(name) for name in TEAM_SHORT_NAMES])
+        
+        starter_index = {}
+        for game in self.projected_starters.values():
+            away_id = resolve_team_id(game.get('away_team'))
+            home_id = resolve_team_id(game.get('home_team'))
+            if away_id is not None and home_id is not None:
+                starter_index[(away_id, home_id)] = (game.get('away_starter'), game.get('home_starter'))
+        self.starter_index = starter_index
+        self._build_matchup_lambda_matrix()
+    
+    def _build_matchup_lambda_matrix(self):
+        """
+        Pre-compute (away_lambda, home_lambda) for every away x home pairing
+        Uses the current projected starters; rebuilt whenever the inputs are reloaded
+        """
+        # Starter quality per pairing: [..., 0] = away starter, [..., 1] = home starter
+        starter_factors = np.ones((NUM_TEAMS, NUM_TEAMS, 2))
+        for (away_id, home_id), (away_starter, home_starter) in self.starter_index.items():
+            starter_factors[away_id, home_id] = (self.get_pitcher_quality_factor(away_starter),
+                                                 self.get_pitcher_quality_factor(home_starter))
+        
+        # Same formula as get_team_multiplier_with_pitchers, broadcast over all pairings
+        away_strength = self.team_strength_array[:, None]
+        home_strength = self.team_strength_array[None, :] + self.home_field_advantage
+        strength_gap = (home_strength - away_strength) * 0.20
+        away_mult = np.clip((1.0 - strength_gap) * starter_factors[..., 1], 0.6, 1.4)
+        home_mult = np.clip((1.0 + strength_gap) * starter_factors[..., 0], 0.6, 1.4)
+        
+        self.matchup_starter_factors = starter_factors
+        self.matchup_lambdas = self.base_lambda * np.stack((away_mult, home_mult), axis=-1)
     
     def setup_fast_distributions(self):
         """Pre-compute probability distributions for vectorized sampling"""
@@ -69,6 +620,126 @@ class UltraFastSimEngine:
         
         # Team advantage multipliers (pre-computed)
         self.advantage_multipliers = np.linspace(0.85, 1.15, 21)  # -1.0 to +1.0 strength diff
+        
+        # Quadrature over the clamped chaos factor for the analytic mode
+        self.chaos_nodes, self.chaos_weights = self._chaos_quadrature(1.0, 0.42, 0.75, 1.25)
+    
+    @staticmethod
+    def _chaos_quadrature(mean: float, std: float, low: float, high: float,
+                          points: int = 8) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Nodes/weights for a normal chaos factor clamped to [low, high]
+        The clamp puts point masses on both bounds; the interior uses Gauss-Legendre
+        """
+        normal_cdf = lambda x: 0.5 * (1.0 + math.erf((x - mean) / (std * math.sqrt(2.0))))
+        legendre_nodes, legendre_weights = np.polynomial.legendre.leggauss(points)
+        half_width = (high - low) / 2.0
+        interior = low + half_width * (legendre_nodes + 1.0)
+        density = np.exp(-0.5 * ((interior - mean) / std) ** 2) / (std * math.sqrt(2.0 * math.pi))
+        
+        nodes = np.concatenate(([low], interior, [high]))
+        weights = np.concatenate(([normal_cdf(low)], legendre_weights * half_width * density,
+                                  [1.0 - normal_cdf(high)]))
+        return nodes, weights / weights.sum()
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _gamma_quadrature(shape: float, points: int = 48) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Nodes/weights for a Gamma(shape, 1/shape) multiplier (mean 1), Gauss-Legendre over its bulk
+        Cached per shape - building the Legendre rule costs ~1ms, far more than a small draw
+        """
+        legendre_nodes, legendre_weights = np.polynomial.legendre.leggauss(points)
+        high = 1.0 + 12.0 / math.sqrt(shape)
+        nodes = high / 2.0 * (legendre_nodes + 1.0)
+        log_density = ((shape - 1.0) * np.log(nodes) - shape * nodes
+                       + shape * math.log(shape) - math.lgamma(shape))
+        weights = legendre_weights * high / 2.0 * np.exp(log_density)
+        return nodes, weights / weights.sum()
+    
+    def _mixing_quadrature(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Quadrature over the scoring model's run multiplier (chaos factor or gamma mixing)"""
+        if self.scoring_model == 'gamma_poisson':
+            return self._gamma_quadrature(self.dispersion_shape)
+        return self.chaos_nodes, self.chaos_weights
+    
+    def _dispersion(self) -> Optional[float]:
+        """Gamma shape for per-simulation mixing, or None when the game-chaos model is active"""
+        return self.dispersion_shape if self.scoring_model == 'gamma_poisson' else None
+    
+    def _score_pmf(self, game_lambdas: np.ndarray) -> np.ndarray:
+        """(..., 25) marginal score pmf for post-chaos lambdas under the active scoring model"""
+        if self.scoring_model == 'gamma_poisson':
+            nodes, weights = self._gamma_quadrature(self.dispersion_shape)
+            return np.einsum('k,...ki->...i', weights,
+                             self._clipped_poisson_pmf(np.asarray(game_lambdas)[..., None] * nodes))
+        return self._clipped_poisson_pmf(game_lambdas)
+    
+    @staticmethod
+    def fit_dispersion_shape(actual_totals: List[float], predicted_totals: List[float]) -> float:
+        """
+        Method-of-moments gamma shape from observed game totals and the model's expected totals
+        Var(total - expected) = E[expected] + E[expected^2] / shape under the gamma-mixed Poisson
+        """
+        actual = np.asarray(actual_totals, dtype=float)
+        expected = np.asarray(predicted_totals, dtype=float)
+        excess = np.mean((actual - expected) ** 2) - expected.mean()
+        if excess <= 0:
+            return MAX_DISPERSION_SHAPE  # No overdispersion beyond Poisson
+        return float(min(MAX_DISPERSION_SHAPE, np.mean(expected ** 2) / excess))
+    
+    @staticmethod
+    def _clipped_poisson_pmf(lambdas: np.ndarray) -> np.ndarray:
+        """Poisson pmf over 0..24 for each lambda, with the tail folded into 24 (matches np.clip)"""
+        lambdas = np.asarray(lambdas, dtype=float)[..., None]
+        ratios = lambdas / np.arange(1, SCORE_BINS)
+        pmf = np.exp(-lambdas) * np.concatenate((np.ones_like(lambdas), np.cumprod(ratios, axis=-1)), axis=-1)
+        pmf[..., -1] += 1.0 - pmf.sum(axis=-1)
+        return pmf
+    
+    def _compute_data_version(self) -> str:
+        """Stable digest of the loaded model inputs - changes only when the data files change"""
+        digest = hashlib.sha256()
+        for data in (self.team_strengths, self.pitcher_stats, self.pitcher_id_map, self.projected_starters):
+            digest.update(json.dumps(data, sort_keys=True).encode('utf-8'))
+        # Tuned curves change every factor; the defaults leave existing versions untouched
+        if self.pitcher_factor_curves != PITCHER_FACTOR_CURVES:
+            digest.update(json.dumps(self.pitcher_factor_curves, sort_keys=True).encode('utf-8'))
+        return digest.hexdigest()[:16]
+    
+    def make_rng(self, *key_parts) -> np.random.Generator:
+        """
+        Independent generator seeded from a stable digest of the key parts plus the data version
+        Unlike hash(), the digest is identical across worker processes and restarts
+        """
+        return np.random.default_rng(self._key_seed(key_parts))
+    
+    def make_seed_sequence(self, *key_parts) -> np.random.SeedSequence:
+        """SeedSequence for the same key, for spawning independent per-task streams"""
+        return np.random.SeedSequence(self._key_seed(key_parts))
+    
+    def _key_seed(self, key_parts: Tuple) -> int:
+        key = "|".join(str(part) for part in key_parts) + f"|{self.data_version}"
+        return int.from_bytes(hashlib.sha256(key.encode('utf-8')).digest()[:8], 'little')
+    
+    def enable_variate_pool(self, block_size: int = VARIATE_POOL_BLOCK_SIZE,
+                            blocks: int = VARIATE_POOL_BLOCKS) -> VariatePool:
+        """
+        Serve plain histogram draws from a background-refilled uniform pool
+        Each request then only inverse-CDF transforms pooled uniforms through the game's joint
+        score CDF; histograms record the pool offset so a draw can be replayed exactly
+        """
+        self.disable_variate_pool()
+        self.variate_pool = VariatePool(self._variate_pool_seed(), block_size, blocks).start()
+        return self.variate_pool
+    
+    def disable_variate_pool(self):
+        if self.variate_pool is not None:
+            self.variate_pool.close()
+            self.variate_pool = None
+    
+    def _variate_pool_seed(self) -> int:
+        return self._key_seed(('variate_pool',))
     
     def _load_team_strengths_fast(self) -> Dict[str, float]:
         """Fast team strength loading with caching and auto-refresh"""
@@ -107,6 +778,27 @@ class UltraFastSimEngine:
             print(f"Warning: Could not load pitcher stats: {e}")
         return {}
     
+    def _load_pitcher_factor_curves(self) -> Dict:
+        """Pitcher quality curves, with any keys from pitcher_factor_curves.json over the defaults"""
+        curves_file = os.path.join(os.path.dirname(__file__), 'pitcher_factor_curves.json')
+        try:
+            if os.path.exists(curves_file):
+                with open(curves_file, 'r') as f:
+                    return self.merge_pitcher_factor_curves(json.load(f))
+        except Exception as e:
+            print(f"Warning: Could not load pitcher factor curves: {e}")
+        return PITCHER_FACTOR_CURVES
+    
+    @staticmethod
+    def merge_pitcher_factor_curves(overrides: Dict) -> Dict:
+        """Defaults updated with the given keys; curve knots must be increasing and match their values"""
+        curves = dict(PITCHER_FACTOR_CURVES, **overrides)
+        for stat in ('era', 'whip', 'innings_pitched'):
+            knots, values = curves[stat]['knots'], curves[stat]['values']
+            if len(knots) != len(values) or not knots or np.any(np.diff(knots) <= 0):
+                raise ValueError(f"Invalid {stat} curve: knots must be increasing and match values")
+        return curves
+    
     def _load_pitcher_id_map(self) -> Dict[str, str]:
         """Load pitcher ID mapping for name resolution"""
         try:
@@ -271,179 +963,186 @@ class UltraFastSimEngine:
         except Exception as e:
             print(f"⚠️ Pitcher data refresh check failed: {e}")
     
+    @staticmethod
+    def _normalize_pitcher_name(pitcher_name: str) -> str:
+        return pitcher_name.strip().lower()
+    
+    def _build_pitcher_table(self):
+        """
+        Parse every pitcher's 2025 stat strings once into columns (ERA, WHIP, starts, innings)
+        Records without usable stats are marked unqualified and keep a neutral 1.0 factor
+        """
+        pitcher_ids, pitcher_names, team_ids = [], [], []
+        rows = []
+        for pitcher_id, data in self.pitcher_stats.items():
+            stats_2025 = data.get('2025') if data else None
+            row = (0.0, 0.0, 0, 0.0, False)
+            if stats_2025:
+                try:
+                    row = (float(stats_2025.get('era', '4.50')), float(stats_2025.get('whip', '1.30')),
+                           int(stats_2025.get('gamesStarted', 0)), 0.0, True)
+                except (ValueError, TypeError):
+                    pass
+                else:
+                    try:
+                        row = row[:3] + (float(stats_2025.get('inningsPitched', '0')), True)
+                    except (ValueError, TypeError):
+                        pass  # Unknown innings - lowest reliability
+            pitcher_ids.append(str(pitcher_id))
+            pitcher_names.append((data or {}).get('name'))
+            team_id = resolve_team_id((data or {}).get('team'))
+            team_ids.append(-1 if team_id is None else team_id)
+            rows.append(row)
+        
+        era, whip, games_started, innings_pitched, has_stats = zip(*rows) if rows else ((),) * 5
+        self.pitcher_ids = pitcher_ids
+        self.pitcher_names = pitcher_names
+        self.pitcher_table = {
+            'era': np.array(era, dtype=float),
+            'whip': np.array(whip, dtype=float),
+            'games_started': np.array(games_started, dtype=int),
+            'innings_pitched': np.array(innings_pitched, dtype=float),
+            'has_stats': np.array(has_stats, dtype=bool),
+            'team_id': np.array(team_ids, dtype=int)
+        }
+    
+    @staticmethod
+    def pitcher_quality_factors(pitcher_table: Dict[str, np.ndarray], curves: Dict = None) -> np.ndarray:
+        """
+        Quality factor column for a whole pitcher table in one vectorized pass
+        <1.0 = good pitcher (allows fewer runs), >1.0 = poor pitcher
+        """
+        curves = curves or PITCHER_FACTOR_CURVES
+        curve = lambda stat: np.interp(pitcher_table[stat], curves[stat]['knots'], curves[stat]['values'])
+        base_factor = curve('era') * curves['era_weight'] + curve('whip') * (1.0 - curves['era_weight'])
+        # Scale the adjustment by innings-pitched reliability, within the realistic MLB range
+        factors = np.clip(1.0 + (base_factor - 1.0) * curve('innings_pitched'), *curves['bounds'])
+        qualified = pitcher_table['has_stats'] & (pitcher_table['games_started'] >= curves['min_games_started'])
+        return np.where(qualified, factors, 1.0)
+    
+    def _build_pitcher_factor_index(self):
+        """
+        Evaluate the quality curves for every pitcher at once, keyed by normalized name and by ID
+        Names resolve from the stats file first, then through the pitcher ID map
+        """
+        self.pitcher_factors = self.pitcher_quality_factors(self.pitcher_table, self.pitcher_factor_curves)
+        index = {}
+        for pitcher_id, name, factor in zip(self.pitcher_ids, self.pitcher_names, self.pitcher_factors.tolist()):
+            index[pitcher_id] = factor
+            if name:
+                # First match wins, same as the old linear scan
+                index.setdefault(self._normalize_pitcher_name(name), factor)
+        
+        for pitcher_name, pitcher_id in self.pitcher_id_map.items():
+            if str(pitcher_id) in index:
+                index.setdefault(self._normalize_pitcher_name(pitcher_name), index[str(pitcher_id)])
+        
+        self.pitcher_factor_index = index
+    
+    def fit_pitcher_factor_curves(self, starter_names: List[str], runs_ratios: List[float],
+                                  ridge: float = PITCHER_CURVE_RIDGE) -> Dict:
+        """
+        Refit the ERA and WHIP knot values from observed starts (innings reliability is kept)
+        runs_ratios: actual / predicted runs allowed by each start's opponent. The target factor is
+        the current factor times that ratio; the factor is linear in the knot values through the
+        interpolation weights, so the knots solve a ridge least-squares problem toward the current curves
+        """
+        curves = self.pitcher_factor_curves
+        rows = self._pitcher_rows(starter_names)
+        ratios = np.asarray(runs_ratios, dtype=float)
+        table = {stat: column[rows] for stat, column in self.pitcher_table.items()}
+        fitted = (rows >= 0) & table['has_stats'] & (table['games_started'] >= curves['min_games_started'])
+        if not fitted.any():
+            return {}
+        table = {stat: column[fitted] for stat, column in table.items()}
+        
+        target = np.clip(self.pitcher_quality_factors(table, curves) * ratios[fitted], *curves['bounds'])
+        reliability = np.interp(table['innings_pitched'], curves['innings_pitched']['knots'],
+                                curves['innings_pitched']['values'])
+        # factor = 1 + (w * era_curve + (1 - w) * whip_curve - 1) * reliability
+        weights = lambda stat: np.stack([np.interp(table[stat], curves[stat]['knots'], unit)
+                                         for unit in np.eye(len(curves[stat]['knots']))], axis=1)
+        design = reliability[:, None] * np.hstack((curves['era_weight'] * weights('era'),
+                                                  (1.0 - curves['era_weight']) * weights('whip')))
+        current = np.array(curves['era']['values'] + curves['whip']['values'], dtype=float)
+        knot_values = np.linalg.solve(design.T @ design + ridge * np.eye(len(current)),
+                                      design.T @ (target - 1.0 + reliability) + ridge * current)
+        
+        era_values, whip_values = np.split(knot_values, [len(curves['era']['values'])])
+        # Worse ERA/WHIP never gets a better factor
+        monotone = lambda values: np.clip(np.maximum.accumulate(values), *curves['bounds']).round(3).tolist()
+        return {
+            'era': {'knots': list(curves['era']['knots']), 'values': monotone(era_values)},
+            'whip': {'knots': list(curves['whip']['knots']), 'values': monotone(whip_values)}
+        }
+    
+    def _pitcher_rows(self, pitcher_names: List[str]) -> np.ndarray:
+        """pitcher_table row per name (-1 when unknown), resolved like the factor index"""
+        rows = {}
+        for row, name in enumerate(self.pitcher_names):
+            if name:
+                rows.setdefault(self._normalize_pitcher_name(name), row)
+        id_rows = {pitcher_id: row for row, pitcher_id in enumerate(self.pitcher_ids)}
+        for pitcher_name, pitcher_id in self.pitcher_id_map.items():
+            if str(pitcher_id) in id_rows:
+                rows.setdefault(self._normalize_pitcher_name(pitcher_name), id_rows[str(pitcher_id)])
+        return np.array([rows.get(self._normalize_pitcher_name(str(name)), -1) for name in pitcher_names], dtype=int)
+    
+    def get_team_rotation(self, team_name: str) -> List[str]:
+        """Qualified starters (min_games_started) currently on the team, most starts first"""
+        team_id = resolve_team_id(team_name)
+        if team_id is None:
+            return []
+        table = self.pitcher_table
+        starts = table['games_started']
+        rotation = np.nonzero((table['team_id'] == team_id) & table['has_stats'] &
+                              (starts >= self.pitcher_factor_curves['min_games_started']))[0]
+        rotation = rotation[np.argsort(-starts[rotation], kind='stable')]
+        return [self.pitcher_names[i] or self.pitcher_ids[i] for i in rotation]
+    
+    def set_pitcher_factor_curves(self, curves: Dict):
+        """Re-evaluate every pitcher factor (and matchup lambdas) under new curve knots"""
+        self.pitcher_factor_curves = self.merge_pitcher_factor_curves(curves)
+        self.data_version = self._compute_data_version()
+        self._build_pitcher_factor_index()
+        self._build_matchup_lambda_matrix()
+    
     def get_pitcher_quality_factor(self, pitcher_name: str) -> float:
         """
         Get pitcher quality factor based on 2025 stats
         Returns multiplier: <1.0 = good pitcher (allows fewer runs), >1.0 = poor pitcher
-        Uses pitcher ID mapping as fallback for name resolution
+        O(1) lookup into the index built at load (name or pitcher ID)
         """
-        if not pitcher_name or not self.pitcher_stats:
-            return 1.0
-        
-        # Find pitcher by direct name match first
-        pitcher_data = None
-        for pitcher_id, data in self.pitcher_stats.items():
-            if data.get('name', '').lower() == pitcher_name.lower():
-                pitcher_data = data
-                break
-        
-        # If direct match fails, try pitcher ID mapping
-        if not pitcher_data and self.pitcher_id_map:
-            if pitcher_name in self.pitcher_id_map:
-                pitcher_id = str(self.pitcher_id_map[pitcher_name])
-                if pitcher_id in self.pitcher_stats:
-                    pitcher_data = self.pitcher_stats[pitcher_id]
-        
-        if not pitcher_data or '2025' not in pitcher_data:
-            return 1.0
-        
-        stats_2025 = pitcher_data['2025']
-        
-        # Key pitcher metrics for run prevention
-        try:
-            era = float(stats_2025.get('era', '4.50'))
-            whip = float(stats_2025.get('whip', '1.30'))
-            games_started = int(stats_2025.get('gamesStarted', 0))
-        except (ValueError, TypeError):
+        if not pitcher_name:
             return 1.0
-        
-        # Only apply to starting pitchers (minimum 5 starts)
-        if games_started < 5:
-            return 1.0
-        
-        # ENHANCED ERA-based adjustment - STRENGTHENED based on 8/8 validation
-        if era < 2.00:
-            era_factor = 0.60  # Cy Young level (elite shutdown) - STRENGTHENED
-        elif era < 2.75:
-            era_factor = 0.70  # Elite pitcher - STRENGTHENED 
-        elif era < 3.50:
-            era_factor = 0.85  # Good pitcher - STRENGTHENED
-        elif era < 4.25:
-            era_factor = 0.95  # Average pitcher - slight adjustment
-        elif era < 5.25:
-            era_factor = 1.15  # Below average - STRENGTHENED penalty
-        elif era < 6.50:
-            era_factor = 1.25  # Poor pitcher - STRENGTHENED penalty
-        else:
-            era_factor = 1.40  # Terrible pitcher - STRENGTHENED penalty
-        
-        # STRENGTHENED WHIP adjustment - based on 8/8 validation
-        if whip < 1.00:
-            whip_factor = 0.80  # Elite control - STRENGTHENED impact
-        elif whip < 1.15:
-            whip_factor = 0.90  # Good control - STRENGTHENED
-        elif whip < 1.30:
-            whip_factor = 0.97  # Average control - slight adjustment
-        elif whip < 1.45:
-            whip_factor = 1.08  # Poor control - STRENGTHENED penalty
-        else:
-            whip_factor = 1.20  # Very poor control - STRENGTHENED penalty
-        
-        # INNINGS PITCHED adjustment (reliability factor)
-        try:
-            innings_pitched = float(stats_2025.get('inningsPitched', '0'))
-            if innings_pitched > 100:
-                ip_factor = 1.0  # Full impact for proven starters
-            elif innings_pitched > 50:
-                ip_factor = 0.8  # Reduced impact for limited data
-            else:
-                ip_factor = 0.5  # Minimal impact for very limited data
-        except:
-            ip_factor = 0.5
-        
-        # Combine factors with enhanced weighting
-        base_factor = (era_factor * 0.70) + (whip_factor * 0.30)
-        
-        # Apply innings pitched reliability
-        quality_factor = 1.0 + ((base_factor - 1.0) * ip_factor)
-        
-        # EXTREME bounds for maximum realistic variance (matches real MLB range)
-        return max(0.50, min(1.60, quality_factor))  # More extreme range to better differentiate pitchers
+        return self.pitcher_factor_index.get(self._normalize_pitcher_name(str(pitcher_name)), 1.0)
     
     def get_matchup_starters(self, away_team: str, home_team: str) -> Tuple[Optional[str], Optional[str]]:
-        """Get projected starters for this matchup"""
-        # Convert short team names to full names
-        away_full = self._get_full_team_name(away_team)
-        home_full = self._get_full_team_name(home_team)
-        
-        # Try multiple matchup formats - START WITH SHORT NAMES (what ProjectedStarters.json actually uses)
-        matchup_formats = [
-            # Try with short names first (this is likely what the file uses)
-            f"{away_team} at {home_team}",
-            f"{away_team} @ {home_team}",
-            f"{home_team} vs {away_team}",
-            f"{home_team} v {away_team}",
-            # Then try with full names
-            f"{away_full} at {home_full}",
-            f"{away_full} @ {home_full}",
-            f"{home_full} vs {away_full}",
-            f"{home_full} v {away_full}",
-            # Mixed formats (short @ full, full @ short, etc.)
-            f"{away_team} at {home_full}",
-            f"{away_full} at {home_team}",
-            f"{away_team} @ {home_full}",
-            f"{away_full} @ {home_team}"
-        ]
-        
-        for matchup in matchup_formats:
-            if matchup in self.projected_starters:
-                data = self.projected_starters[matchup]
-                away_starter = data.get('away_starter')
-                home_starter = data.get('home_starter')
-                return away_starter, home_starter
-        
-        return None, None
-    
-    def _get_full_team_name(self, short_name: str) -> str:
-        """Convert short team names to full names for projected starters lookup"""
-        team_mapping = {
-            # American League
-            'Angels': 'Los Angeles Angels',
-            'Astros': 'Houston Astros',
-            'Athletics': 'Oakland Athletics',
-            'Blue Jays': 'Toronto Blue Jays',
-            'Indians': 'Cleveland Guardians',
-            'Guardians': 'Cleveland Guardians',
-            'Mariners': 'Seattle Mariners',
-            'Orioles': 'Baltimore Orioles',
-            'Rangers': 'Texas Rangers',
-            'Rays': 'Tampa Bay Rays',
-            'Red Sox': 'Boston Red Sox',
-            'Royals': 'Kansas City Royals',
-            'Tigers': 'Detroit Tigers',
-            'Twins': 'Minnesota Twins',
-            'White Sox': 'Chicago White Sox',
-            'Yankees': 'New York Yankees',
-            
-            # National League
-            'Braves': 'Atlanta Braves',
-            'Brewers': 'Milwaukee Brewers',
-            'Cardinals': 'St. Louis Cardinals',
-            'Cubs': 'Chicago Cubs',
-            'Diamondbacks': 'Arizona Diamondbacks',
-            'Dodgers': 'Los Angeles Dodgers',
-            'Giants': 'San Francisco Giants',
-            'Marlins': 'Miami Marlins',
-            'Mets': 'New York Mets',
-            'Nationals': 'Washington Nationals',
-            'Padres': 'San Diego Padres',
-            'Phillies': 'Philadelphia Phillies',
-            'Pirates': 'Pittsburgh Pirates',
-            'Reds': 'Cincinnati Reds',
-            'Rockies': 'Colorado Rockies'
-        }
-        
-        return team_mapping.get(short_name, short_name)
+        """Get projected starters for this matchup (any team alias accepted)"""
+        away_id = resolve_team_id(away_team)
+        home_id = resolve_team_id(home_team)
+        return self.starter_index.get((away_id, home_id), (None, None))
     
     def _setup_speed_cache(self):
         """Setup caching for maximum speed"""
         self.home_field_advantage = 0.15
         self.base_runs_per_team = 4.3  # OPTIMIZED: Balanced for realistic MLB totals (8-9 avg) with controlled variance
+        # OPTIMIZED Poisson parameters for balanced performance
+        # Base lambda fine-tuned for consistent 8-9 run average with good variance
+        self.base_lambda = 4.2  # Tuned to hit 8.86 MLB average target
+        # Per-simulation gamma mixing: shape 6.0 reproduces the real 4.66 std dev of game totals
+        # (method of moments on 8.86 mean); fit with fit_dispersion_shape
+        self.scoring_model = 'gamma_poisson'
+        self.dispersion_shape = 6.0
+    
+    def _team_strength(self, team_name: str) -> float:
+        """Strength for the exact team name as given (0.0 when the strength data uses another form)"""
+        return self.team_strengths.get(team_name, 0.0)
     
     def get_team_multiplier_with_pitchers(self, away_team: str, home_team: str) -> Tuple[float, float]:
         """Get run multipliers for both teams including pitcher quality"""
-        away_strength = self.team_strengths.get(away_team, 0.0)
-        home_strength = self.team_strengths.get(home_team, 0.0) + self.home_field_advantage
+        away_strength = self._team_strength(away_team)
+        home_strength = self._team_strength(home_team) + self.home_field_advantage
         
         # Get projected starters
         away_starter, home_starter = self.get_matchup_starters(away_team, home_team)
@@ -470,18 +1169,24 @@ class UltraFastSimEngine:
         """Legacy method for compatibility - now uses pitcher data"""
         return self.get_team_multiplier_with_pitchers(away_team, home_team)
     
-    def simulate_game_vectorized(self, away_team: str, home_team: str, 
-                               sim_count: int = 100) -> List[FastGameResult]:
-        """
-        Ultra-fast vectorized simulation with EXTREME variance to match real MLB
-        Uses Poisson distribution with team/pitcher adjustments for realistic variance
-        STABILIZED: Uses consistent seed for more reliable predictions
-        """
-        # Set consistent seed based on teams for more stable predictions
-        seed_value = hash(f"{away_team}{home_team}") % 1000000
-        np.random.seed(seed_value)
-        random.seed(seed_value)
+    def _game_lambdas(self, away_team: str, home_team: str) -> Tuple[float, float, Dict]:
+        """Resolve starters and team/pitcher multipliers into pre-chaos Poisson lambdas"""
+        away_id = resolve_team_id(away_team)
+        home_id = resolve_team_id(home_team)
+        if (away_id is not None and home_id is not None
+                and (away_team, home_team) == (TEAM_SHORT_NAMES[away_id], TEAM_SHORT_NAMES[home_id])):
+            # Known teams by short name: precomputed matrix lookup, no multiplier math per request
+            away_starter, home_starter = self.starter_index.get((away_id, home_id), (None, None))
+            away_pitcher_factor, home_pitcher_factor = self.matchup_starter_factors[away_id, home_id]
+            away_lambda, home_lambda = self.matchup_lambdas[away_id, home_id]
+            return float(away_lambda), float(home_lambda), {
+                'away_pitcher_name': away_starter,
+                'home_pitcher_name': home_starter,
+                'away_pitcher_factor': float(away_pitcher_factor),
+                'home_pitcher_factor': float(home_pitcher_factor)
+            }
         
+        # Unknown teams and other name forms fall back to the scalar path
         # Get pitcher information for return
         away_starter, home_starter = self.get_matchup_starters(away_team, home_team)
         
@@ -491,58 +1196,579 @@ class UltraFastSimEngine:
         
         away_mult, home_mult = self.get_team_multiplier_with_pitchers(away_team, home_team)
         
-        # OPTIMIZED Poisson parameters for balanced performance
-        # Base lambda fine-tuned for consistent 8-9 run average with good variance
-        base_lambda = 4.2  # Tuned to hit 8.86 MLB average target
-        
         # Apply team and pitcher multipliers with EXTREME variance
-        away_lambda = base_lambda * away_mult
-        home_lambda = base_lambda * home_mult
+        away_lambda = self.base_lambda * away_mult
+        home_lambda = self.base_lambda * home_mult
         
+        return away_lambda, home_lambda, {
+            'away_pitcher_name': away_starter,
+            'home_pitcher_name': home_starter,
+            'away_pitcher_factor': away_pitcher_factor,
+            'home_pitcher_factor': home_pitcher_factor
+        }
+    
+    def game_rng(self, away_team: str, home_team: str, game_date: str = None) -> np.random.Generator:
+        """Per-game generator keyed on (date, matchup, data version)"""
+        game_date = game_date or datetime.now().strftime('%Y-%m-%d')
+        return self.make_rng(game_date, f"{away_team} @ {home_team}")
+    
+    def _draw_chaos_factor(self, rng: np.random.Generator) -> float:
+        """Game-level chaos factor shared by both teams (1.0 under gamma mixing - no draw)"""
+        if self.scoring_model == 'gamma_poisson':
+            return 1.0
         # REFINED: Create balanced game-level variance with optimal MLB realism
         # This single variance factor applies to the ENTIRE prediction
         # Tuned for realistic MLB game distribution: 8 avg, 3+ std dev
-        game_chaos_factor = np.random.normal(1.0, 0.42)  # OPTIMIZED: Validated 0.42 for realistic MLB variance
-        game_chaos_factor = max(0.75, min(1.25, game_chaos_factor))  # Tighter bounds to prevent extreme scores
+        game_chaos_factor = rng.normal(1.0, 0.42)  # OPTIMIZED: Validated 0.42 for realistic MLB variance
+        return max(0.75, min(1.25, game_chaos_factor))  # Tighter bounds to prevent extreme scores
+    
+    def _variance_reduced_uniforms(self, rng: np.random.Generator, game_count: int,
+                                   block_size: int, method: str) -> np.ndarray:
+        """
+        (2, games, blocks * block_size) uniforms for away/home inverse-CDF sampling
+        Each block is an independent replicate so the estimator variance can be measured
+        """
+        shape = (2, game_count, VARIANCE_REDUCTION_BLOCKS, block_size)
+        if method == 'antithetic':
+            half = rng.random(shape[:-1] + (block_size // 2,))
+            uniforms = np.concatenate((half, 1.0 - half), axis=-1)
+        elif method == 'stratified':
+            # Latin hypercube: one draw per stratum, strata shuffled independently for away/home
+            strata = np.argsort(rng.random(shape), axis=-1)
+            uniforms = (strata + rng.random(shape)) / block_size
+        else:
+            raise ValueError(f"Unknown variance reduction method: {method}")
+        return uniforms.reshape(2, game_count, -1)
+    
+    def _draw_scores(self, rng: np.random.Generator, game_lambdas: np.ndarray, sim_count: int,
+                     variance_reduction: str = None) -> Tuple[np.ndarray, np.ndarray]:
+        """(games x sims) away/home score matrices for per-game (away, home) lambdas"""
+        if not variance_reduction:
+            chunks = list(self._iter_score_chunks(rng, game_lambdas, sim_count, self._dispersion(),
+                                                  self.score_dtype, self.lambda_dtype))
+            if len(chunks) == 1:
+                return chunks[0]
+            return (np.concatenate([away for away, _ in chunks], axis=1),
+                    np.concatenate([home for _, home in chunks], axis=1))
+        
+        # Inverse-CDF sampling from correlated uniforms (block size kept even for antithetic pairs)
+        block_size = -(-sim_count // VARIANCE_REDUCTION_BLOCKS)
+        block_size += block_size % 2
+        uniforms = self._variance_reduced_uniforms(rng, len(game_lambdas), block_size, variance_reduction)
+        dispersion = self._dispersion()
+        if dispersion:
+            # Plain gamma multiplier per sim; scores are inverse-CDF sampled conditional on it
+            mixing = self._draw_mixing(rng, dispersion, uniforms.shape[1:], self.lambda_dtype)
+            cdf = np.cumsum(self._clipped_poisson_pmf(game_lambdas[:, None, :] * mixing[..., None]), axis=-1)
+        else:
+            cdf = np.cumsum(self._clipped_poisson_pmf(game_lambdas), axis=-1)[:, None]
+        away_scores = (uniforms[0][..., None] >= cdf[..., 0, :]).sum(axis=-1)
+        home_scores = (uniforms[1][..., None] >= cdf[..., 1, :]).sum(axis=-1)
+        return (self._compact_scores(away_scores, self.score_dtype),
+                self._compact_scores(home_scores, self.score_dtype))
+    
+    @staticmethod
+    def _draw_mixing(rng: np.random.Generator, dispersion_shape: float, shape: Tuple,
+                     lambda_dtype: type = LAMBDA_DTYPE) -> np.ndarray:
+        """Per-sim Gamma(k, 1/k) multipliers in a lambda_dtype buffer"""
+        mixing = rng.standard_gamma(dispersion_shape, shape, dtype=lambda_dtype)
+        mixing *= lambda_dtype(1.0 / dispersion_shape)
+        return mixing
+    
+    @staticmethod
+    def _compact_scores(scores: np.ndarray, score_dtype: type = SCORE_DTYPE) -> np.ndarray:
+        """Clip raw run counts to MAX_TEAM_RUNS straight into a score_dtype buffer"""
+        return np.minimum(scores, MAX_TEAM_RUNS, out=np.empty(scores.shape, dtype=score_dtype),
+                          casting='unsafe')
+    
+    @staticmethod
+    def _iter_score_chunks(rng: np.random.Generator, game_lambdas: np.ndarray, sim_count: int,
+                           dispersion_shape: Optional[float] = None,
+                           score_dtype: type = SCORE_DTYPE, lambda_dtype: type = LAMBDA_DTYPE):
+        """
+        Plain draws as (games x chunk) away/home blocks of at most STREAM_CHUNK_SIZE sims
+        With dispersion_shape, each sim scales both lambdas by one shared Gamma(k, 1/k) multiplier
+        """
+        for chunk_start in range(0, sim_count, STREAM_CHUNK_SIZE):
+            shape = (len(game_lambdas), min(STREAM_CHUNK_SIZE, sim_count - chunk_start))
+            if dispersion_shape:
+                mixing = UltraFastSimEngine._draw_mixing(rng, dispersion_shape, shape, lambda_dtype)
+                compact_lambdas = game_lambdas.astype(lambda_dtype)
+                away_lambdas, home_lambdas = compact_lambdas[:, :1] * mixing, compact_lambdas[:, 1:] * mixing
+            else:
+                # Lambdas broadcast across the sim axis - no per-sim lambda arrays
+                away_lambdas, home_lambdas = game_lambdas[:, :1], game_lambdas[:, 1:]
+            # numpy's Poisson sampler always emits int64, so each draw is clipped into a uint8 buffer at once
+            away_scores = UltraFastSimEngine._compact_scores(rng.poisson(away_lambdas, shape), score_dtype)
+            home_scores = UltraFastSimEngine._compact_scores(rng.poisson(home_lambdas, shape), score_dtype)
+            yield away_scores, home_scores
+    
+    @staticmethod
+    def _stream_counts(rng: np.random.Generator, game_lambdas: np.ndarray, sim_count: int,
+                       dispersion_shape: Optional[float] = None,
+                       score_dtype: type = SCORE_DTYPE, lambda_dtype: type = LAMBDA_DTYPE) -> np.ndarray:
+        """Accumulate (games x 25 x 25) joint counts chunk by chunk - memory independent of sim_count"""
+        counts = np.zeros((len(game_lambdas), SCORE_BINS, SCORE_BINS), dtype=np.int64)
+        for away_scores, home_scores in UltraFastSimEngine._iter_score_chunks(rng, game_lambdas, sim_count,
+                                                                              dispersion_shape, score_dtype,
+                                                                              lambda_dtype):
+            counts += JointScoreHistogram.batch_counts(away_scores, home_scores)
+        return counts
+    
+    def _joint_score_cdf(self, game_lambdas: np.ndarray) -> np.ndarray:
+        """
+        (games x 625) CDF over the flattened (away, home) index for post-chaos lambdas
+        Gamma mixing uses the same quadrature as analytic mode
+        """
+        if self.scoring_model == 'gamma_poisson':
+            nodes, weights = self._gamma_quadrature(self.dispersion_shape)
+            node_pmf = self._clipped_poisson_pmf(game_lambdas[..., None] * nodes)
+            joint = (node_pmf[:, 0] * weights[:, None]).transpose(0, 2, 1) @ node_pmf[:, 1]
+        else:
+            pmf = self._clipped_poisson_pmf(game_lambdas)
+            joint = pmf[:, 0, :, None] * pmf[:, 1, None, :]
+        return np.cumsum(joint.reshape(len(game_lambdas), -1), axis=-1)
+    
+    def _pool_counts(self, game_lambdas: np.ndarray, sim_count: int,
+                     variate_offset: Optional[int] = None) -> Tuple[np.ndarray, int]:
+        """
+        (games x 25 x 25) counts from one pooled uniform per sim, plus the pool offset used
+        With variate_offset the same uniforms are regenerated instead of taken (replay)
+        """
+        pool = self.variate_pool or VariatePool(self._variate_pool_seed())
+        variate_count = len(game_lambdas) * sim_count
+        if variate_offset is None:
+            variate_offset, uniforms = pool.take(variate_count)
+        else:
+            uniforms = pool.variates(variate_offset, variate_count)
+        return self._inverse_cdf_counts(game_lambdas, uniforms.reshape(len(game_lambdas), -1)), variate_offset
+    
+    def _inverse_cdf_counts(self, game_lambdas: np.ndarray, uniforms: np.ndarray) -> np.ndarray:
+        """
+        (games x 25 x 25) counts from (games x sims) uniforms through each game's joint score CDF
+        A (1 x sims) row is shared by every game (common random numbers)
+        """
+        # Game g's CDF and uniforms are shifted by g, so one searchsorted over the whole batch
+        # lands directly on the (game, away, home) flat index
+        game_count, grid_size = len(game_lambdas), SCORE_BINS * SCORE_BINS
+        game_shift = np.arange(game_count)[:, None]
+        cdf = self._joint_score_cdf(game_lambdas) + game_shift
+        flat_index = np.searchsorted(cdf.ravel(), (uniforms + game_shift).ravel(), side='right')
+        flat_index = flat_index.reshape(game_count, -1)
+        # A uniform above the rounded CDF total falls into the game's last bin
+        np.minimum(flat_index, game_shift * grid_size + grid_size - 1, out=flat_index)
+        counts = np.bincount(flat_index.ravel(), minlength=game_count * grid_size)
+        return counts.reshape(game_count, SCORE_BINS, SCORE_BINS)
+    
+    def _executor_counts(self, game_lambdas: np.ndarray, sim_count: int,
+                         seed_keys: List[Tuple]) -> np.ndarray:
+        """
+        Shard each game's sims into executor tasks and merge the returned counts
+        Tasks only carry (away, home) lambdas, a sim count and a SeedSequence; the split depends on
+        sim_count alone, so results are identical for any pool size
+        """
+        shard_sizes = [PARALLEL_TASK_SIMS] * (sim_count // PARALLEL_TASK_SIMS)
+        if sim_count % PARALLEL_TASK_SIMS:
+            shard_sizes.append(sim_count % PARALLEL_TASK_SIMS)
+        
+        game_futures = []
+        for lambdas, seed_key in zip(game_lambdas, seed_keys):
+            seeds = self.make_seed_sequence('parallel', *seed_key).spawn(len(shard_sizes))
+            game_futures.append([self.executor.submit(simulate_counts_task, lambdas, shard_sims, seed,
+                                                      self._dispersion(), self.score_dtype, self.lambda_dtype)
+                                 for shard_sims, seed in zip(shard_sizes, seeds)])
+        
+        counts = np.zeros((len(game_lambdas), SCORE_BINS, SCORE_BINS), dtype=np.int64)
+        for game_counts, futures in zip(counts, game_futures):
+            for future in futures:
+                game_counts += future.result()
+        return counts
+    
+    def _variance_reduced_estimates(self, away_scores: np.ndarray, home_scores: np.ndarray,
+                                    game_lambdas: np.ndarray) -> List[Dict]:
+        """
+        Control-variate estimates per game using the known (clipped) score means
+        Means are exact; home win prob uses the run differential as control.
+        Effective sample size comes from the spread of the independent block estimates.
+        """
+        game_count = len(game_lambdas)
+        pmf = self._score_pmf(game_lambdas)
+        known_means = pmf @ np.arange(SCORE_BINS)
+        known_diff = known_means[:, 1] - known_means[:, 0]
+        
+        home_wins = (home_scores > away_scores).astype(float)
+        run_diffs = home_scores.astype(float) - away_scores
+        diff_var = run_diffs.var(axis=1)
+        covariance = (home_wins * run_diffs).mean(axis=1) - home_wins.mean(axis=1) * run_diffs.mean(axis=1)
+        beta = np.divide(covariance, diff_var, out=np.zeros(game_count), where=diff_var > 0)
+        
+        block_wins = home_wins.reshape(game_count, VARIANCE_REDUCTION_BLOCKS, -1).mean(axis=2)
+        block_diffs = run_diffs.reshape(game_count, VARIANCE_REDUCTION_BLOCKS, -1).mean(axis=2)
+        block_estimates = block_wins - beta[:, None] * (block_diffs - known_diff[:, None])
+        
+        win_prob = np.clip(block_estimates.mean(axis=1), 0.0, 1.0)
+        estimator_var = block_estimates.var(axis=1, ddof=1) / VARIANCE_REDUCTION_BLOCKS
+        sim_count = away_scores.shape[1]
+        effective = np.divide(win_prob * (1.0 - win_prob), estimator_var,
+                              out=np.full(game_count, float(sim_count)), where=estimator_var > 0)
+        
+        return [{
+            'mean_away': float(known_means[i, 0]),
+            'mean_home': float(known_means[i, 1]),
+            'home_win_prob': float(win_prob[i]),
+            'effective_sample_size': int(effective[i])
+        } for i in range(game_count)]
+    
+    def simulate_game_vectorized(self, away_team: str, home_team: str, 
+                               sim_count: int = 100, game_date: str = None,
+                               rng: np.random.Generator = None,
+                               variance_reduction: str = None) -> Tuple[SimulationResults, Dict]:
+        """
+        Ultra-fast vectorized simulation with EXTREME variance to match real MLB
+        Uses Poisson distribution with team/pitcher adjustments for realistic variance
+        STABILIZED: Each call owns a generator seeded from (date, matchup, data version),
+        so results are reproducible across threads, workers and restarts
+        variance_reduction: None, 'antithetic' or 'stratified' (opt-in, adds control variates)
+        """
+        rng = rng or self.game_rng(away_team, home_team, game_date)
+        
+        away_lambda, home_lambda, pitcher_info = self._game_lambdas(away_team, home_team)
+        game_chaos_factor = self._draw_chaos_factor(rng)
         
         # Apply chaos to both teams (correlated - high/low scoring games affect both)
-        away_lambda *= game_chaos_factor
-        home_lambda *= game_chaos_factor
+        game_lambdas = np.array([[away_lambda, home_lambda]]) * game_chaos_factor
         
-        # Generate multiple simulations but with this single game variance
-        away_lambdas = np.full(sim_count, away_lambda)
-        home_lambdas = np.full(sim_count, home_lambda)
+        # Generate scores (Poisson naturally creates realistic variance, clipped at 24 runs)
+        away_scores, home_scores = self._draw_scores(rng, game_lambdas, sim_count, variance_reduction)
         
-        # Generate scores using Poisson distribution (naturally creates realistic variance)
-        away_scores = np.random.poisson(away_lambdas)
-        home_scores = np.random.poisson(home_lambdas)
+        # Columnar results - no per-simulation Python objects
+        results = SimulationResults(away_scores[0], home_scores[0])
+        if variance_reduction:
+            results.estimates = self._variance_reduced_estimates(away_scores, home_scores, game_lambdas)[0]
+            results.estimates['variance_reduction'] = variance_reduction
+
+        return results, pitcher_info
+
+    def simulate_game_histogram(self, away_team: str, home_team: str,
+                                sim_count: int = 100, game_date: str = None,
+                                variance_reduction: str = None,
+                                variate_offset: Optional[int] = None) -> Tuple[JointScoreHistogram, Dict]:
+        """
+        Simulate a game and return the joint 25x25 score histogram (canonical engine output)
+        Plain draws stream into the histogram chunk by chunk, so 1M+ sims use constant memory
+        With the variate pool enabled (or a variate_offset to replay) draws come from the pool
+        """
+        if variance_reduction:
+            results, pitcher_info = self.simulate_game_vectorized(away_team, home_team, sim_count, game_date,
+                                                                  variance_reduction=variance_reduction)
+            return results.histogram(), pitcher_info
+        
+        # Same generator sequence as simulate_game_vectorized, so the histogram is identical
+        game_date = game_date or datetime.now().strftime('%Y-%m-%d')
+        rng = self.game_rng(away_team, home_team, game_date)
+        away_lambda, home_lambda, pitcher_info = self._game_lambdas(away_team, home_team)
+        game_lambdas = np.array([[away_lambda, home_lambda]]) * self._draw_chaos_factor(rng)
+        if self.variate_pool or variate_offset is not None:
+            counts, variate_offset = self._pool_counts(game_lambdas, sim_count, variate_offset)
+        elif self.executor:
+            counts = self._executor_counts(game_lambdas, sim_count, [(game_date, f"{away_team} @ {home_team}")])
+        else:
+            counts = self._stream_counts(rng, game_lambdas, sim_count, self._dispersion(),
+                                         self.score_dtype, self.lambda_dtype)
+        histogram = JointScoreHistogram(counts[0])
+        histogram.variate_offset = variate_offset
+        return histogram, pitcher_info
+
+    def analytic_game_histogram(self, away_team: str, home_team: str) -> Tuple[JointScoreHistogram, Dict]:
+        """
+        Exact joint score distribution with zero sampling
+        Independent Poisson scores per multiplier node, mixed over the scoring model's quadrature
+        """
+        away_lambda, home_lambda, pitcher_info = self._game_lambdas(away_team, home_team)
+        nodes, weights = self._mixing_quadrature()
+        away_pmf = self._clipped_poisson_pmf(away_lambda * nodes)
+        home_pmf = self._clipped_poisson_pmf(home_lambda * nodes)
+        joint = np.einsum('k,ki,kj->ij', weights, away_pmf, home_pmf)
+        return JointScoreHistogram(joint, exact=True), pitcher_info
+
+    def _slate_lambdas(self, games: List[Tuple[str, str]], game_date: str) -> Tuple[np.ndarray, List[Dict]]:
+        """(games x 2) post-chaos lambdas plus pitcher info for every game in a slate"""
+        game_lambdas = np.empty((len(games), 2))
+        pitcher_infos = []
+        for i, (away_team, home_team) in enumerate(games):
+            away_lambda, home_lambda, pitcher_info = self._game_lambdas(away_team, home_team)
+            # Chaos factor comes from the game's own generator, so it matches the single-game path
+            chaos = self._draw_chaos_factor(self.game_rng(away_team, home_team, game_date))
+            game_lambdas[i] = (away_lambda * chaos, home_lambda * chaos)
+            pitcher_infos.append(pitcher_info)
+        return game_lambdas, pitcher_infos
+    
+    def simulate_slate(self, games: List[Tuple[str, str]], sim_count: int = 1500,
+                       game_date: str = None,
+                       variance_reduction: str = None,
+                       variate_offset: Optional[int] = None) -> List[Tuple[JointScoreHistogram, Dict]]:
+        """
+        Simulate a whole slate in one vectorized draw
+        Builds a (games x sims) lambda matrix and returns one histogram per game, in input order
+        Pooled draws use sim_count consecutive variates per game, starting at the first game's offset
+        """
+        if not games:
+            return []
+        
+        game_date = game_date or datetime.now().strftime('%Y-%m-%d')
+        
+        game_lambdas, pitcher_infos = self._slate_lambdas(games, game_date)
+        
+        # One generator for the slate draw, keyed on the date and every matchup in it
+        rng = self.make_rng(game_date, *(f"{away} @ {home}" for away, home in games))
+        
+        if not variance_reduction:
+            game_offsets = [None] * len(games)
+            if self.variate_pool or variate_offset is not None:
+                # Pre-generated uniforms through each game's joint CDF - no sampler calls online
+                counts, variate_offset = self._pool_counts(game_lambdas, sim_count, variate_offset)
+                game_offsets = [variate_offset + i * sim_count for i in range(len(games))]
+            elif self.executor:
+                # Independent games (and sim shards) spread over the pluggable executor
+                counts = self._executor_counts(game_lambdas, sim_count,
+                                               [(game_date, f"{away} @ {home}") for away, home in games])
+            else:
+                # (games x chunk) draws streamed into per-game counts - constant memory at any depth
+                counts = self._stream_counts(rng, game_lambdas, sim_count, self._dispersion(),
+                                         self.score_dtype, self.lambda_dtype)
+            results = []
+            for game_counts, pitcher_info, game_offset in zip(counts, pitcher_infos, game_offsets):
+                histogram = JointScoreHistogram(game_counts)
+                histogram.variate_offset = game_offset
+                results.append((histogram, pitcher_info))
+            return results
+        
+        # (games x sims) draw for the whole slate
+        away_scores, home_scores = self._draw_scores(rng, game_lambdas, sim_count, variance_reduction)
+        
+        histograms = JointScoreHistogram.batch_from_scores(away_scores, home_scores)
+        estimates = self._variance_reduced_estimates(away_scores, home_scores, game_lambdas)
+        for histogram, game_estimates in zip(histograms, estimates):
+            histogram.estimates = dict(game_estimates, variance_reduction=variance_reduction)
+        return list(zip(histograms, pitcher_infos))
+
+    def _starter_swap_lambdas(self, away_team: str, home_team: str, away_starters: List[str],
+                              home_starters: List[str]) -> Tuple[np.ndarray, List[Dict]]:
+        """
+        (combinations x 2) pre-chaos lambdas for every away x home starter pairing (away-major)
+        Same multiplier formula as the matchup matrix, broadcast over the candidate factors
+        """
+        away_factors = np.array([self.get_pitcher_quality_factor(name) for name in away_starters])
+        home_factors = np.array([self.get_pitcher_quality_factor(name) for name in home_starters])
+        strength_gap = (self._team_strength(home_team) + self.home_field_advantage
+                        - self._team_strength(away_team)) * 0.20
+        # Home starter limits away scoring and vice versa
+        away_mult = np.clip((1.0 - strength_gap) * home_factors[None, :], 0.6, 1.4)
+        home_mult = np.clip((1.0 + strength_gap) * away_factors[:, None], 0.6, 1.4)
+        lambdas = self.base_lambda * np.stack(np.broadcast_arrays(away_mult, home_mult), axis=-1).reshape(-1, 2)
+        
+        pitcher_infos = [{
+            'away_pitcher_name': away_starter,
+            'home_pitcher_name': home_starter,
+            'away_pitcher_factor': float(away_factor),
+            'home_pitcher_factor': float(home_factor)
+        } for away_starter, away_factor in zip(away_starters, away_factors)
+          for home_starter, home_factor in zip(home_starters, home_factors)]
+        return lambdas, pitcher_infos
+    
+    def simulate_starter_swaps(self, away_team: str, home_team: str, away_starters: List[str],
+                               home_starters: List[str], sim_count: int = 2000,
+                               game_date: str = None) -> List[Tuple[JointScoreHistogram, Dict]]:
+        """
+        What-if repricing: one batched draw for every away x home candidate starter combination
+        All combinations share the game's chaos factor and the same uniforms (common random numbers),
+        so differences between candidates reflect the pitchers rather than sampling noise
+        """
+        if not away_starters or not home_starters:
+            return []
+        game_date = game_date or datetime.now().strftime('%Y-%m-%d')
+        lambdas, pitcher_infos = self._starter_swap_lambdas(away_team, home_team, away_starters, home_starters)
+        lambdas *= self._draw_chaos_factor(self.game_rng(away_team, home_team, game_date))
+        
+        rng = self.make_rng('starter_swap', game_date, f"{away_team} @ {home_team}")
+        counts = self._inverse_cdf_counts(lambdas, rng.random((1, sim_count)))
+        return [(JointScoreHistogram(game_counts), pitcher_info)
+                for game_counts, pitcher_info in zip(counts, pitcher_infos)]
+    
+    def _inning_lambdas(self, game_lambdas: np.ndarray, pitcher_infos: List[Dict]) -> np.ndarray:
+        """
+        (games x 2 x 9) half-inning lambdas for the (away, home) offenses
+        Innings 1-5 are weighted by the opposing starter's quality factor and the bullpen innings
+        by 1.0, normalized so each team's nine innings still sum to its game lambda
+        """
+        opposing_starter = np.array([[info['home_pitcher_factor'], info['away_pitcher_factor']]
+                                     for info in pitcher_infos], dtype=float)
+        weights = np.ones((len(game_lambdas), 2, INNINGS))
+        weights[..., :STARTER_INNINGS] = opposing_starter[..., None]
+        weights *= INNINGS / weights.sum(axis=-1, keepdims=True)
+        return game_lambdas[..., None] / INNINGS * weights
+    
+    def _draw_innings_scores(self, rng: np.random.Generator, inning_lambdas: np.ndarray,
+                             sim_count: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        (games x sims) final scores from a (games x sims x 9) half-inning run matrix
+        Home skips the bottom of the 9th when ahead and a walk-off stops at the winning run;
+        tied games go to extras with a runner on second until one side wins (no ties).
+        Also returns the regulation away/home run matrices (unplayed bottom of the 9th = 0 runs)
+        """
+        shape = (len(inning_lambdas), sim_count, INNINGS)
+        dispersion = self._dispersion()
+        if dispersion:
+            # One gamma multiplier per sim, shared by every half-inning of both teams
+            mixing = self._draw_mixing(rng, dispersion, shape[:2], self.lambda_dtype)
+            away_innings = rng.poisson(inning_lambdas[:, None, 0, :] * mixing[..., None], shape)
+            home_innings = rng.poisson(inning_lambdas[:, None, 1, :] * mixing[..., None], shape)
+        else:
+            away_innings = rng.poisson(inning_lambdas[:, None, 0, :], shape)
+            home_innings = rng.poisson(inning_lambdas[:, None, 1, :], shape)
+        
+        away_scores = away_innings.sum(axis=2)
+        home_through_8 = home_innings[..., :-1].sum(axis=2)
+        
+        # Runs the home team needs in the bottom of the 9th to win (<= 0: already ahead, does not bat)
+        runs_needed = away_scores - home_through_8 + 1
+        home_innings[..., -1] = np.clip(home_innings[..., -1], 0, np.maximum(runs_needed, 0))
+        home_scores = home_through_8 + home_innings[..., -1]
+        
+        # Extra innings against the bullpen, one inning per pass over the games that are still tied
+        tied = np.nonzero(away_scores == home_scores)
+        while tied[0].size:
+            extra_lambdas = inning_lambdas[tied[0], :, -1] * (mixing[tied][:, None] if dispersion else 1.0)
+            extra_lambdas += GHOST_RUNNER_EXTRA_RUNS
+            away_runs = rng.poisson(extra_lambdas[:, 0])
+            home_runs = np.minimum(rng.poisson(extra_lambdas[:, 1]), away_runs + 1)
+            away_scores[tied] += away_runs
+            home_scores[tied] += home_runs
+            still_tied = away_runs == home_runs
+            tied = (tied[0][still_tied], tied[1][still_tied])
+
+        # Clip to the score grid without re-creating ties: the winner is capped and the
+        # loser stays strictly below the capped winner
+        winner_cap = np.minimum(np.maximum(away_scores, home_scores), MAX_TEAM_RUNS)
+        away_won = away_scores > home_scores
+        away_scores, home_scores = (np.where(away_won, winner_cap, np.minimum(away_scores, winner_cap - 1)),
+                                    np.where(away_won, np.minimum(home_scores, winner_cap - 1), winner_cap))
+
+        return (self._compact_scores(away_scores, self.score_dtype),
+                self._compact_scores(home_scores, self.score_dtype), away_innings, home_innings)
+    
+    def simulate_game_innings(self, away_team: str, home_team: str, sim_count: int = 100,
+                              game_date: str = None) -> Tuple[SimulationResults, Dict]:
+        """Inning-by-inning simulation of one game (same lambdas and chaos as the flat path)"""
+        rng = self.game_rng(away_team, home_team, game_date)
+        away_lambda, home_lambda, pitcher_info = self._game_lambdas(away_team, home_team)
+        game_lambdas = np.array([[away_lambda, home_lambda]]) * self._draw_chaos_factor(rng)
+        inning_lambdas = self._inning_lambdas(game_lambdas, [pitcher_info])
+        away_scores, home_scores, _, _ = self._draw_innings_scores(rng, inning_lambdas, sim_count)
+        return SimulationResults(away_scores[0], home_scores[0]), pitcher_info
+    
+    def simulate_slate_innings(self, games: List[Tuple[str, str]], sim_count: int = 1500,
+                               game_date: str = None) -> List[Tuple[JointScoreHistogram, Dict]]:
+        """
+        Inning-by-inning slate simulation, streamed in chunks into one histogram per game
+        Each histogram carries .inning_markets (first five innings and per-inning run counts)
+        accumulated from the same batch
+        """
+        if not games:
+            return []
+        
+        game_date = game_date or datetime.now().strftime('%Y-%m-%d')
+        game_lambdas, pitcher_infos = self._slate_lambdas(games, game_date)
+        inning_lambdas = self._inning_lambdas(game_lambdas, pitcher_infos)
+        rng = self.make_rng('innings', game_date, *(f"{away} @ {home}" for away, home in games))
+        
+        game_count = len(games)
+        counts = np.zeros((game_count, SCORE_BINS, SCORE_BINS), dtype=np.int64)
+        first_five_counts = np.zeros_like(counts)
+        inning_run_counts = np.zeros((game_count, 2, INNINGS, INNING_RUN_BINS), dtype=np.int64)
+        scoreless_counts = np.zeros((game_count, INNINGS), dtype=np.int64)
+        for chunk_start in range(0, sim_count, STREAM_CHUNK_SIZE):
+            chunk_sims = min(STREAM_CHUNK_SIZE, sim_count - chunk_start)
+            away_scores, home_scores, away_innings, home_innings = self._draw_innings_scores(
+                rng, inning_lambdas, chunk_sims)
+            counts += JointScoreHistogram.batch_counts(away_scores, home_scores)
+            
+            # Market counts from the same run matrices - a few extra bincounts per chunk
+            first_five_counts += JointScoreHistogram.batch_counts(
+                self._compact_scores(away_innings[..., :STARTER_INNINGS].sum(axis=2), self.score_dtype),
+                self._compact_scores(home_innings[..., :STARTER_INNINGS].sum(axis=2), self.score_dtype))
+            half_innings = np.minimum(np.stack((away_innings, home_innings), axis=1), INNING_RUN_BINS - 1)
+            half_inning_index = (np.arange(game_count * 2 * INNINGS).reshape(game_count, 2, 1, INNINGS)
+                                 * INNING_RUN_BINS + half_innings)
+            inning_run_counts += np.bincount(half_inning_index.ravel(), minlength=inning_run_counts.size
+                                             ).reshape(inning_run_counts.shape)
+            scoreless_counts += ((away_innings == 0) & (home_innings == 0)).sum(axis=1)
+        
+        results = []
+        for i, pitcher_info in enumerate(pitcher_infos):
+            histogram = JointScoreHistogram(counts[i])
+            histogram.inning_markets = InningMarkets(first_five_counts[i], inning_run_counts[i],
+                                                     scoreless_counts[i])
+            results.append((histogram, pitcher_info))
+        return results
+    
+    def simulate_slate_adaptive(self, games: List[Tuple[str, str]], max_sims: int = 2000,
+                                game_date: str = None,
+                                tolerance: Dict[str, float] = None) -> List[Tuple[JointScoreHistogram, Dict, Dict]]:
+        """
+        Simulate in blocks, stopping each game once its standard errors are within tolerance
+        Lopsided, low-variance games stop early; close or high-scoring ones keep drawing up to max_sims.
+        Returns (histogram, pitcher_info, convergence) per game, in input order
+        """
+        if not games:
+            return []
         
-        # Allow extreme scores like real MLB (max observed: 24 runs per team)
-        away_scores = np.clip(away_scores, 0, 24)
-        home_scores = np.clip(home_scores, 0, 24)
+        game_date = game_date or datetime.now().strftime('%Y-%m-%d')
+        tolerance = dict(ADAPTIVE_TOLERANCE, **(tolerance or {}))
+        max_sims = max(int(max_sims), 1)
         
-        # Create results (vectorized operations)
-        total_runs = away_scores + home_scores
-        home_wins = home_scores > away_scores
-        run_diffs = home_scores - away_scores
+        game_lambdas, pitcher_infos = self._slate_lambdas(games, game_date)
         
-        # Convert to result objects (only loop we need)
-        results = []
-        for i in range(sim_count):
-            results.append(FastGameResult(
-                away_score=int(away_scores[i]),
-                home_score=int(home_scores[i]),
-                total_runs=int(total_runs[i]),
-                home_wins=bool(home_wins[i]),
-                run_differential=int(run_diffs[i])
-            ))
-        
-        return results, {
-            'away_pitcher_name': away_starter,
-            'home_pitcher_name': home_starter,
-            'away_pitcher_factor': away_pitcher_factor,
-            'home_pitcher_factor': home_pitcher_factor
-        }
+        rng = self.make_rng('adaptive', game_date, *(f"{away} @ {home}" for away, home in games))
+        
+        histograms = [JointScoreHistogram(np.zeros((SCORE_BINS, SCORE_BINS), dtype=np.int64))
+                      for _ in games]
+        standard_errors = [None] * len(games)
+        converged = [False] * len(games)
+        active = list(range(len(games)))
+        
+        # Two blocks minimum so the first standard-error estimate is not from a tiny sample
+        min_sims = 2 * ADAPTIVE_BLOCK_SIZE
+        while active:
+            block_size = min(ADAPTIVE_BLOCK_SIZE, max_sims - int(histograms[active[0]].sim_count))
+            away_scores, home_scores = self._draw_scores(rng, game_lambdas[active], block_size)
+            block_histograms = JointScoreHistogram.batch_from_scores(away_scores, home_scores)
+            
+            still_active = []
+            for i, block_histogram in zip(active, block_histograms):
+                histograms[i] = histograms[i] + block_histogram
+                standard_errors[i] = histograms[i].standard_errors()
+                sims = histograms[i].sim_count
+                converged[i] = sims >= min_sims and all(
+                    standard_errors[i][stat] <= tolerance[stat] for stat in tolerance)
+                if not converged[i] and sims < max_sims:
+                    still_active.append(i)
+            active = still_active
+        
+        return [(histogram, pitcher_info, {
+            'standard_errors': {stat: round(se, 4) for stat, se in errors.items()},
+            'tolerance': tolerance,
+            'converged': converged_flag
+        }) for histogram, pitcher_info, errors, converged_flag
+            in zip(histograms, pitcher_infos, standard_errors, converged)]
+
+def simulate_counts_task(game_lambdas: np.ndarray, sim_count: int, seed: np.random.SeedSequence,
+                         dispersion_shape: Optional[float] = None,
+                         score_dtype: type = SCORE_DTYPE, lambda_dtype: type = LAMBDA_DTYPE) -> np.ndarray:
+    """Executor task: 25x25 joint counts for one game's (away, home) lambdas (module-level so it pickles)"""
+    rng = np.random.default_rng(seed)
+    return UltraFastSimEngine._stream_counts(rng, game_lambdas[None, :], sim_count, dispersion_shape,
+                                             score_dtype, lambda_dtype)[0]
 
 class SmartBettingAnalyzer:
     """
@@ -602,21 +1828,36 @@ class SmartBettingAnalyzer:
         return recommendations
     
     def analyze_total_value(self, predicted_total: float, total_line: float,
-                          over_odds: int = -110, under_odds: int = -110) -> List[Dict]:
-        """Fast total runs value analysis"""
+                          over_odds: int = -110, under_odds: int = -110,
+                          over_prob: float = None, under_prob: float = None) -> List[Dict]:
+        """
+        Fast total runs value analysis
+        over_prob/under_prob come from the simulated total distribution (a whole line's push is the
+        remainder, refunded in the EV); without them a linear approximation is used.
+        On a half-point line either one alone is enough
+        """
         recommendations = []
         
-        # Calculate edge for over/under
-        over_prob = 0.5 + (predicted_total - total_line) * 0.05  # Simplified model
-        under_prob = 1 - over_prob
+        if over_prob is None and under_prob is None:
+            over_prob = min(1.0, max(0.0, 0.5 + (predicted_total - total_line) * 0.05))  # Simplified model
+            under_prob = 1 - over_prob
+        elif under_prob is None:
+            under_prob = float(self._complement_total_prob(total_line, over_prob))
+        elif over_prob is None:
+            over_prob = float(self._complement_total_prob(total_line, under_prob))
+        push_prob = max(0.0, 1.0 - over_prob - under_prob)
+        # Win probability given the bet is not refunded
+        decided = over_prob + under_prob
+        over_win = over_prob / decided if decided > 0 else 0.5
+        under_win = 1 - over_win
         
         over_implied = self._odds_to_prob(over_odds)
         under_implied = self._odds_to_prob(under_odds)
         
         # Check over value
-        if over_prob > over_implied + self.min_edge:
-            ev = (over_prob * self._calculate_payout(over_odds)) - (1 - over_prob)
-            kelly_size = min(self.kelly_fraction, ev * over_prob) * 100
+        if over_win > over_implied + self.min_edge:
+            ev = ((over_win * self._calculate_payout(over_odds)) - (1 - over_win)) * (1 - push_prob)
+            kelly_size = min(self.kelly_fraction, ev * over_win) * 100
             
             recommendations.append({
                 'type': 'total',
@@ -624,6 +1865,8 @@ class SmartBettingAnalyzer:
                 'line': total_line,
                 'odds': over_odds,
                 'model_total': round(predicted_total, 1),
+                'model_prob': round(over_win, 3),
+                'push_prob': round(push_prob, 3),
                 'edge': round(predicted_total - total_line, 1),
                 'expected_value': round(ev, 3),
                 'kelly_bet_size': round(kelly_size, 1),
@@ -632,9 +1875,9 @@ class SmartBettingAnalyzer:
             })
         
         # Check under value
-        if under_prob > under_implied + self.min_edge:
-            ev = (under_prob * self._calculate_payout(under_odds)) - (1 - under_prob)
-            kelly_size = min(self.kelly_fraction, ev * under_prob) * 100
+        if under_win > under_implied + self.min_edge:
+            ev = ((under_win * self._calculate_payout(under_odds)) - (1 - under_win)) * (1 - push_prob)
+            kelly_size = min(self.kelly_fraction, ev * under_win) * 100
             
             recommendations.append({
                 'type': 'total',
@@ -642,6 +1885,8 @@ class SmartBettingAnalyzer:
                 'line': total_line,
                 'odds': under_odds,
                 'model_total': round(predicted_total, 1),
+                'model_prob': round(under_win, 3),
+                'push_prob': round(push_prob, 3),
                 'edge': round(total_line - predicted_total, 1),
                 'expected_value': round(ev, 3),
                 'kelly_bet_size': round(kelly_size, 1),
@@ -651,6 +1896,295 @@ class SmartBettingAnalyzer:
         
         return recommendations
     
+    def analyze_moneyline_batch(self, home_win_probs, away_win_probs, home_odds, away_odds) -> List[List[Dict]]:
+        """
+        Moneyline value for a whole slate (same output as analyze_moneyline_value per game)
+        Implied probabilities, EV, edge and Kelly sizes are (games x 2) arrays; dicts are only
+        built for the rows that clear min_edge
+        """
+        model_probs = np.column_stack((home_win_probs, away_win_probs)).astype(float)
+        odds = np.column_stack((home_odds, away_odds))
+        implied, ev, kelly_size, value = self._value_arrays(model_probs, odds)
+        
+        recommendations = [[] for _ in range(len(model_probs))]
+        games, sides = np.nonzero(value)
+        for game, side, side_odds, model_prob, implied_prob, bet_ev, bet_size in zip(
+                games.tolist(), sides.tolist(), odds[games, sides].tolist(), model_probs[games, sides].tolist(),
+                implied[games, sides].tolist(), ev[games, sides].tolist(), kelly_size[games, sides].tolist()):
+            recommendations[game].append({
+                'type': 'moneyline',
+                'side': ('home', 'away')[side],
+                'team': ('home', 'away')[side],
+                'odds': side_odds,
+                'model_prob': round(model_prob, 3),
+                'implied_prob': round(implied_prob, 3),
+                'expected_value': round(bet_ev, 3),
+                'edge': round(model_prob - implied_prob, 3),
+                'kelly_bet_size': round(bet_size, 1),
+                'confidence': 'HIGH' if bet_ev > 0.1 else 'MEDIUM',
+                'reasoning': f"Model: {model_prob:.1%} vs Market: {implied_prob:.1%}"
+            })
+        return recommendations
+    
+    @staticmethod
+    def _complement_total_prob(total_lines, side_probs) -> np.ndarray:
+        """Other side of a total - only a half-point line has no push to leave out"""
+        total_lines = np.asarray(total_lines, dtype=float)
+        if np.any(total_lines == np.round(total_lines)):
+            raise ValueError("Whole total lines can push: pass both over and under probabilities")
+        return 1 - np.asarray(side_probs, dtype=float)
+    
+    def analyze_total_batch(self, predicted_totals, total_lines, over_odds, under_odds,
+                            over_probs=None, under_probs=None) -> List[List[Dict]]:
+        """
+        Total runs value for a whole slate (same output as analyze_total_value per row)
+        Rows can be games or every (game, alternate line) pair of a ladder
+        """
+        predicted_totals = np.asarray(predicted_totals, dtype=float)
+        total_lines = np.asarray(total_lines)
+        if over_probs is None and under_probs is None:
+            over_probs = np.clip(0.5 + (predicted_totals - total_lines) * 0.05, 0.0, 1.0)  # Simplified model
+            under_probs = 1 - over_probs
+        elif under_probs is None:
+            under_probs = self._complement_total_prob(total_lines, over_probs)
+        elif over_probs is None:
+            over_probs = self._complement_total_prob(total_lines, under_probs)
+        over_probs, under_probs = np.asarray(over_probs, dtype=float), np.asarray(under_probs, dtype=float)
+        push_probs = np.maximum(1.0 - over_probs - under_probs, 0.0)
+        decided = over_probs + under_probs
+        over_win = np.divide(over_probs, decided, out=np.full(len(decided), 0.5), where=decided > 0)
+        model_probs = np.column_stack((over_win, 1 - over_win))
+        odds = np.column_stack((over_odds, under_odds))
+        _, ev, kelly_size, value = self._value_arrays(model_probs, odds, push_probs[:, None])
+        
+        recommendations = [[] for _ in range(len(model_probs))]
+        games, sides = np.nonzero(value)
+        for game, side, side_odds, predicted_total, total_line, model_prob, push_prob, bet_ev, bet_size in zip(
+                games.tolist(), sides.tolist(), odds[games, sides].tolist(), predicted_totals[games].tolist(),
+                total_lines[games].tolist(), model_probs[games, sides].tolist(), push_probs[games].tolist(),
+                ev[games, sides].tolist(), kelly_size[games, sides].tolist()):
+            recommendations[game].append({
+                'type': 'total',
+                'side': ('over', 'under')[side],
+                'line': total_line,
+                'odds': side_odds,
+                'model_total': round(predicted_total, 1),
+                'model_prob': round(model_prob, 3),
+                'push_prob': round(push_prob, 3),
+                'edge': round(predicted_total - total_line if side == 0 else total_line - predicted_total, 1),
+                'expected_value': round(bet_ev, 3),
+                'kelly_bet_size': round(bet_size, 1),
+                'confidence': 'HIGH' if abs(predicted_total - total_line) > 1.0 else 'MEDIUM',
+                'reasoning': f"Model: {predicted_total:.1f} vs Line: {total_line}"
+            })
+        return recommendations
+    
+    def analyze_spread_batch(self, home_spreads, home_cover_probs, away_cover_probs,
+                             home_odds, away_odds) -> List[List[Dict]]:
+        """
+        Run line value for a whole slate - rows can be games or every (game, alternate spread) pair
+        Cover probabilities come from the simulated run differential; a whole spread's push is refunded
+        """
+        home_spreads = np.asarray(home_spreads, dtype=float)
+        home_cover_probs = np.asarray(home_cover_probs, dtype=float)
+        away_cover_probs = np.asarray(away_cover_probs, dtype=float)
+        push_probs = np.maximum(1.0 - home_cover_probs - away_cover_probs, 0.0)
+        decided = home_cover_probs + away_cover_probs
+        home_win = np.divide(home_cover_probs, decided, out=np.full(len(decided), 0.5), where=decided > 0)
+        model_probs = np.column_stack((home_win, 1 - home_win))
+        odds = np.column_stack((home_odds, away_odds))
+        implied, ev, kelly_size, value = self._value_arrays(model_probs, odds, push_probs[:, None])
+        
+        recommendations = [[] for _ in range(len(model_probs))]
+        games, sides = np.nonzero(value)
+        for game, side, side_odds, home_spread, model_prob, implied_prob, push_prob, bet_ev, bet_size in zip(
+                games.tolist(), sides.tolist(), odds[games, sides].tolist(), home_spreads[games].tolist(),
+                model_probs[games, sides].tolist(), implied[games, sides].tolist(), push_probs[games].tolist(),
+                ev[games, sides].tolist(), kelly_size[games, sides].tolist()):
+            line = home_spread if side == 0 else -home_spread
+            recommendations[game].append({
+                'type': 'run_line',
+                'side': ('home', 'away')[side],
+                'line': line,
+                'odds': side_odds,
+                'model_prob': round(model_prob, 3),
+                'implied_prob': round(implied_prob, 3),
+                'push_prob': round(push_prob, 3),
+                'expected_value': round(bet_ev, 3),
+                'edge': round(model_prob - implied_prob, 3),
+                'kelly_bet_size': round(bet_size, 1),
+                'confidence': 'HIGH' if bet_ev > 0.1 else 'MEDIUM',
+                'reasoning': f"Model: {model_prob:.1%} to cover {line:+g} vs Market: {implied_prob:.1%}"
+            })
+        return recommendations
+    
+    def _value_arrays(self, model_probs: np.ndarray, odds: np.ndarray,
+                      push_probs: np.ndarray = 0.0) -> Tuple[np.ndarray, ...]:
+        """
+        Implied probabilities, EV, Kelly sizes (%) and the min_edge mask for model probs vs American odds
+        model_probs are win probabilities given no push; pushed stakes are refunded in the EV
+        """
+        odds = odds.astype(float)
+        abs_odds = np.abs(odds)
+        implied = np.where(odds > 0, 100 / (odds + 100), abs_odds / (abs_odds + 100))
+        with np.errstate(divide='ignore'):
+            payout = np.where(odds > 0, odds / 100, 100 / abs_odds)
+        ev = ((model_probs * payout) - (1 - model_probs)) * (1 - push_probs)
+        kelly_size = np.minimum(self.kelly_fraction, ev * model_probs) * 100
+        return implied, ev, kelly_size, model_probs > implied + self.min_edge
+    
+    @staticmethod
+    def fair_odds(probs) -> np.ndarray:
+        """No-vig American odds for win probabilities (clipped to +/-99900)"""
+        probs = np.clip(np.asarray(probs, dtype=float), 0.001, 0.999)
+        return np.round(np.where(probs >= 0.5, -100 * probs / (1 - probs), 100 * (1 - probs) / probs)).astype(int)
+    
+    def alt_totals_ladder(self, histogram: 'JointScoreHistogram', lines=ALT_TOTAL_LINES) -> List[Dict]:
+        """Over/under/push probabilities and fair odds for every alternate total line"""
+        over, under, push = histogram.total_line_probs(lines)
+        decided = np.maximum(over + under, 1e-12)
+        fair_over, fair_under = self.fair_odds(over / decided), self.fair_odds(under / decided)
+        return [{
+            'line': line,
+            'over_prob': round(over_prob, 3),
+            'under_prob': round(under_prob, 3),
+            'push_prob': round(push_prob, 3),
+            'fair_over_odds': over_odds,
+            'fair_under_odds': under_odds
+        } for line, over_prob, under_prob, push_prob, over_odds, under_odds in zip(
+            lines, over.tolist(), under.tolist(), push.tolist(), fair_over.tolist(), fair_under.tolist())]
+    
+    def alt_spreads_ladder(self, histogram: 'JointScoreHistogram', home_spreads=ALT_SPREAD_LINES) -> List[Dict]:
+        """Home/away cover and push probabilities and fair odds for every alternate home spread"""
+        home, away, push = histogram.spread_cover_probs(home_spreads)
+        decided = np.maximum(home + away, 1e-12)
+        fair_home, fair_away = self.fair_odds(home / decided), self.fair_odds(away / decided)
+        return [{
+            'home_spread': spread,
+            'home_cover_prob': round(home_prob, 3),
+            'away_cover_prob': round(away_prob, 3),
+            'push_prob': round(push_prob, 3),
+            'fair_home_odds': home_odds,
+            'fair_away_odds': away_odds
+        } for spread, home_prob, away_prob, push_prob, home_odds, away_odds in zip(
+            home_spreads, home.tolist(), away.tolist(), push.tolist(), fair_home.tolist(), fair_away.tolist())]
+    
+    def settlement_returns(self, recommendations: List[Dict]) -> np.ndarray:
+        """
+        Per-unit-stake return of each recommendation in every cell of the score grid (bets x 625)
+        Each bet wins when its margin (a linear function of the two scores) is positive and pushes at zero;
+        a moneyline tie goes to extra innings, settled as a coin flip
+        """
+        coefficients = np.empty((len(recommendations), 3))
+        odds = np.empty(len(recommendations))
+        moneyline = np.zeros(len(recommendations), dtype=bool)
+        for i, rec in enumerate(recommendations):
+            if rec['type'] == 'moneyline':
+                sign = 1 if rec['side'] == 'home' else -1
+                coefficients[i] = (-sign, sign, 0.0)
+                moneyline[i] = True
+            elif rec['type'] in ('total', 'alt_total'):
+                sign = 1 if rec['side'] == 'over' else -1
+                coefficients[i] = (sign, sign, -sign * rec['line'])
+            elif rec['type'] in ('run_line', 'alt_run_line'):
+                sign = 1 if rec['side'] == 'home' else -1
+                coefficients[i] = (-sign, sign, rec['line'])
+            else:
+                raise ValueError(f"Cannot settle recommendation type '{rec['type']}'")
+            odds[i] = rec['odds']
+        
+        payout = np.where(odds > 0, odds / 100, 100 / np.abs(odds))
+        margins = coefficients @ _SETTLEMENT_BASIS
+        push_return = np.where(moneyline, (payout - 1) / 2, 0.0)
+        returns = np.where(margins > 0, payout[:, None], -1.0)
+        return np.where(margins == 0, push_return[:, None], returns)
+    
+    def size_portfolio(self, histograms: List['JointScoreHistogram'], recommendations: List[List[Dict]],
+                       rng: np.random.Generator, max_exposure: float = PORTFOLIO_MAX_EXPOSURE,
+                       scenarios: int = PORTFOLIO_SCENARIOS) -> Tuple[List[List[float]], Dict]:
+        """
+        Simultaneous fractional-Kelly stakes (fractions of bankroll) for every recommendation on a slate
+        Scenarios hold one joint score per game, so bets on the same game share outcomes (a moneyline and
+        its total are correlated) while games stay independent. Full-Kelly stakes maximize the mean log
+        wealth over the scenarios with sum(stakes) <= max_exposure / kelly_fraction, then scale by kelly_fraction.
+        """
+        bets = [rec for game_recs in recommendations for rec in game_recs]
+        stakes = [[0.0] * len(game_recs) for game_recs in recommendations]
+        if not bets:
+            return stakes, {'exposure': 0.0, 'expected_log_growth': 0.0, 'iterations': 0}
+        
+        bet_games = np.repeat(np.arange(len(recommendations)), [len(game_recs) for game_recs in recommendations])
+        # Latin hypercube scenarios: one draw per quantile stratum for every game, independently shuffled
+        # across games, so each bet's win/push odds match its histogram to within 1/scenarios
+        # (one searchsorted over every game's CDF, shifted by the game index, on sorted strata)
+        game_count = len(recommendations)
+        cell_cdfs = np.cumsum(np.stack([histogram.counts.ravel() for histogram in histograms]), axis=1)
+        cell_cdfs = cell_cdfs / cell_cdfs[:, -1:] + np.arange(game_count)[:, None]
+        quantiles = (np.arange(scenarios) + rng.random((game_count, scenarios))) / scenarios
+        sorted_cells = np.searchsorted(cell_cdfs.ravel(), (quantiles + np.arange(game_count)[:, None]).ravel(),
+                                       side='right').reshape(game_count, scenarios)
+        sorted_cells = np.minimum(sorted_cells - np.arange(game_count)[:, None] * cell_cdfs.shape[1],
+                                  cell_cdfs.shape[1] - 1)
+        scenario_cells = np.take_along_axis(sorted_cells, rng.random((game_count, scenarios)).argsort(axis=1), axis=1)
+        # (scenarios x bets) returns, gathered from each bet's settlement grid
+        scenario_returns = np.take_along_axis(self.settlement_returns(bets), scenario_cells[bet_games], axis=1).T
+        
+        full_kelly_budget = min(max_exposure / self.kelly_fraction, 0.95)  # Keeps every scenario's wealth positive
+        full_kelly, iterations = self._kelly_ascent(scenario_returns, full_kelly_budget)
+        bet_stakes = full_kelly * self.kelly_fraction
+        
+        flat_stakes = iter(bet_stakes.tolist())
+        stakes = [[next(flat_stakes) for _ in game_recs] for game_recs in recommendations]
+        return stakes, {
+            'exposure': float(bet_stakes.sum()),
+            'expected_log_growth': float(np.log1p(scenario_returns @ bet_stakes).mean()),
+            'iterations': iterations
+        }
+    
+    @staticmethod
+    def _kelly_ascent(scenario_returns: np.ndarray, budget: float) -> Tuple[np.ndarray, int]:
+        """
+        Accelerated projected gradient ascent on mean(log(1 + returns @ f)) over {f >= 0, sum(f) <= budget}
+        The step backtracks whenever the quadratic bound fails; momentum restarts when growth drops
+        """
+        scenarios, bet_count = scenario_returns.shape
+        curvature = max(float((scenario_returns * scenario_returns).mean(axis=0).max()), 1e-12)
+        stakes = momentum = np.zeros(bet_count)
+        t, growth = 1.0, -np.inf
+        for iteration in range(1, PORTFOLIO_MAX_ITERATIONS + 1):
+            wealth = 1.0 + scenario_returns @ momentum
+            momentum_growth = np.log(wealth).mean()
+            gradient = (1.0 / wealth) @ scenario_returns / scenarios
+            while True:
+                next_stakes = SmartBettingAnalyzer._project_capped_simplex(momentum + gradient / curvature, budget)
+                step = next_stakes - momentum
+                next_growth = np.log1p(scenario_returns @ next_stakes).mean()
+                if next_growth >= momentum_growth + gradient @ step - 0.5 * curvature * (step @ step) - 1e-12:
+                    break
+                curvature *= 2
+            if np.abs(next_stakes - stakes).max() < PORTFOLIO_TOLERANCE:
+                return next_stakes, iteration
+            if next_growth < growth:
+                t, momentum = 1.0, next_stakes
+            else:
+                next_t = (1 + math.sqrt(1 + 4 * t * t)) / 2
+                momentum = SmartBettingAnalyzer._project_capped_simplex(
+                    next_stakes + ((t - 1) / next_t) * (next_stakes - stakes), budget)
+                t = next_t
+            stakes, growth = next_stakes, next_growth
+        return stakes, PORTFOLIO_MAX_ITERATIONS
+    
+    @staticmethod
+    def _project_capped_simplex(values: np.ndarray, budget: float) -> np.ndarray:
+        """Euclidean projection onto {f >= 0, sum(f) <= budget}"""
+        clipped = np.maximum(values, 0.0)
+        if clipped.sum() <= budget:
+            return clipped
+        ordered = np.sort(values)[::-1]
+        excess = np.cumsum(ordered) - budget
+        active = np.count_nonzero(ordered * np.arange(1, len(values) + 1) > excess)
+        return np.maximum(values - excess[active - 1] / active, 0.0)
+    
     def _odds_to_prob(self, odds: int) -> float:
         """Convert American odds to probability"""
         if odds > 0:
@@ -670,11 +2204,45 @@ class FastPredictionEngine:
     Complete fast prediction engine combining simulation and betting analysis
     """
     
-    def __init__(self):
-        self.sim_engine = UltraFastSimEngine()
+    # Stored bookmaker markets -> betting line keys, in the stored [away, home] / [Over, Under] outcome order
+    MARKET_LINE_KEYS = {
+        'moneyline': ('away_ml', 'home_ml'),
+        'runline': ('spread_away_odds', 'spread_odds'),
+        'total': ('over_odds', 'under_odds')
+    }
+    # Recommendation (type, side) -> the betting line key it was priced against
+    RECOMMENDATION_LINE_KEYS = {
+        ('moneyline', 'home'): 'home_ml', ('moneyline', 'away'): 'away_ml',
+        ('total', 'over'): 'over_odds', ('total', 'under'): 'under_odds',
+        ('run_line', 'home'): 'spread_odds', ('run_line', 'away'): 'spread_away_odds'
+    }
+    
+    def __init__(self, executor: Optional[Executor] = None):
+        """executor: optional pool that histogram simulations are spread over (offline batch jobs)"""
+        self.sim_engine = UltraFastSimEngine(executor)
         self.betting_analyzer = SmartBettingAnalyzer()
         self.historical_betting_lookup = HistoricalBettingLinesLookup()
         self._load_historical_cache()
+        
+        # Observed stage costs used to plan deadline-bound requests
+        self.stage_costs_ms = dict(DEADLINE_STAGE_COSTS_MS)
+        self.sim_cost_ms = DEADLINE_SIM_COST_MS
+        # Dates with a historical results update running outside a request's deadline
+        self._background_updates = set()
+        self._background_lock = threading.Lock()
+    
+    def set_executor(self, executor: Optional[Executor]):
+        """Plug in (or remove, with None) the executor used for histogram simulations"""
+        self.sim_engine.executor = executor
+    
+    def _record_stage_cost(self, stage: str, elapsed_ms: float):
+        """Exponential moving average of a stage's observed cost"""
+        self.stage_costs_ms[stage] = 0.8 * self.stage_costs_ms[stage] + 0.2 * elapsed_ms
+    
+    def _record_sim_cost(self, elapsed_ms: float, game_sims: int):
+        """Exponential moving average of the cost of one simulated game"""
+        if game_sims > 0:
+            self.sim_cost_ms = 0.8 * self.sim_cost_ms + 0.2 * elapsed_ms / game_sims
     
     def _load_historical_cache(self):
         """Load historical predictions cache and merge with betting lines data"""
@@ -713,26 +2281,58 @@ class FastPredictionEngine:
         except (FileNotFoundError, json.JSONDecodeError):
             self.historical_cache = {}
     
-    def _auto_update_historical_results_if_needed(self, game_date: str):
-        """Auto-update historical results for completed games"""
+    def _historical_results_need_update(self, game_date: str) -> bool:
+        """True if a historical date is missing from the cache or has games without actual results"""
         if not self._is_historical_date(game_date):
-            return  # Not a historical date, skip
+            return False  # Not a historical date, skip
             
         # Check if this date exists in cache and has actual results
         if game_date in self.historical_cache:
             cached_predictions = self.historical_cache[game_date].get('cached_predictions', {})
             
             # Check if any games are missing actual results
-            needs_update = False
             for game_key, prediction in cached_predictions.items():
                 if 'actual_away_score' not in prediction or 'actual_home_score' not in prediction:
-                    needs_update = True
-                    break
+                    return True
             
-            if not needs_update:
-                return  # All games already have actual results
+            return False  # All games already have actual results
         
-        # Import and run the historical results updater
+        return True
+    
+    def _auto_update_historical_results_if_needed(self, game_date: str, budget: PredictionBudget = None):
+        """
+        Auto-update historical results for completed games
+        When the update does not fit the request's budget it runs on a background thread instead
+        """
+        if not self._historical_results_need_update(game_date):
+            return
+        
+        if budget and not budget.allows('historical_auto_update', self.stage_costs_ms['historical_auto_update']):
+            self._start_background_historical_update(game_date)
+            return
+        
+        self._update_historical_results(game_date)
+    
+    def _start_background_historical_update(self, game_date: str):
+        """Run the historical results update outside the request deadline (one thread per date)"""
+        with self._background_lock:
+            if game_date in self._background_updates:
+                return
+            self._background_updates.add(game_date)
+        print(f"⏱️ Historical results update for {game_date} moved to the background (deadline)")
+        
+        def run_update():
+            try:
+                self._update_historical_results(game_date)
+            finally:
+                with self._background_lock:
+                    self._background_updates.discard(game_date)
+        
+        threading.Thread(target=run_update, name=f'historical-update-{game_date}', daemon=True).start()
+    
+    def _update_historical_results(self, game_date: str):
+        """Import and run the historical results updater, recording its cost"""
+        stage_start = time.perf_counter()
         try:
             print(f"🔄 Auto-updating historical results for {game_date}...")
             from auto_update_historical_results import HistoricalResultsUpdater
@@ -749,6 +2349,8 @@ class FastPredictionEngine:
             print(f"⚠️ Historical results updater not available: {e}")
         except Exception as e:
             print(f"⚠️ Error updating historical results: {e}")
+        
+        self._record_stage_cost('historical_auto_update', (time.perf_counter() - stage_start) * 1000)
             
     def _find_matching_betting_lines(self, betting_games, game_key):
         """Find matching betting lines for a game prediction"""
@@ -822,22 +2424,13 @@ class FastPredictionEngine:
             f"{home_team} @ {away_team}",  # In case it's stored backwards
         ]
         
-        # Also try team name mappings (e.g., HOU -> Astros)
-        team_name_map = {
-            'HOU': 'Astros', 'NYY': 'Yankees', 'LAD': 'Dodgers', 'SF': 'Giants',
-            'CIN': 'Reds', 'PIT': 'Pirates', 'BAL': 'Orioles', 'OAK': 'Athletics',
-            'KC': 'Royals', 'MIN': 'Twins', 'NYM': 'Mets', 'MIL': 'Brewers',
-            'CHC': 'Cubs', 'STL': 'Cardinals', 'COL': 'Rockies', 'ARI': 'Diamondbacks',
-            'BOS': 'Red Sox', 'SD': 'Padres', 'TB': 'Rays', 'SEA': 'Mariners',
-            'TOR': 'Blue Jays', 'WSH': 'Nationals', 'LAA': 'Angels', 'DET': 'Tigers',
-            'MIA': 'Marlins', 'ATL': 'Braves', 'CLE': 'Guardians', 'CWS': 'White Sox',
-            'PHI': 'Phillies', 'TEX': 'Rangers'
-        }
-        
-        if away_team in team_name_map and home_team in team_name_map:
+        # Also try canonical short names (e.g., HOU -> Astros)
+        away_short = to_short_name(away_team)
+        home_short = to_short_name(home_team)
+        if (away_short, home_short) != (away_team, home_team):
             possible_keys.extend([
-                f"{team_name_map[away_team]} @ {team_name_map[home_team]}",
-                f"{team_name_map[home_team]} @ {team_name_map[away_team]}"
+                f"{away_short} @ {home_short}",
+                f"{home_short} @ {away_short}"
             ])
         
         for game_key in possible_keys:
@@ -879,63 +2472,260 @@ class FastPredictionEngine:
         return None
         
     def get_fast_prediction(self, away_team: str, home_team: str, 
-                          sim_count: int = 2000, game_date: str = None) -> Dict:
+                          sim_count: int = 2000, game_date: str = None,
+                          mode: str = 'simulation', variance_reduction: str = None,
+                          tolerance: Dict[str, float] = None,
+                          deadline_ms: Optional[float] = None,
+                          variate_offset: Optional[int] = None) -> Dict:
         """
         Generate complete prediction with recommendations in <200ms
+        mode='analytic' computes the exact score distribution instead of sampling (sim_count unused)
+        mode='adaptive' stops once the standard errors are within tolerance (sim_count is the cap)
+        mode='innings' simulates half-innings, so ties go to extras instead of counting as away wins
+        variance_reduction='antithetic'/'stratified' reaches the same precision with fewer sims
+        deadline_ms scales the sim count and skips optional stages to fit the budget
+        (reported in meta['degraded_stages'])
+        variate_offset replays a pooled draw recorded in meta['variate_offset'] (same sim_count)
         """
+        self._validate_mode(mode, variance_reduction)
+        
         start_time = datetime.now()
+        budget = PredictionBudget(deadline_ms)
         
         # Check for historical data first
         if game_date and self._is_historical_date(game_date):
             # Auto-update historical results if needed
-            self._auto_update_historical_results_if_needed(game_date)
+            self._auto_update_historical_results_if_needed(game_date, budget)
             
             historical_result = self._get_cached_historical_prediction(away_team, home_team, game_date)
             if historical_result:
                 return historical_result
         
-        # Run ultra-fast simulations
-        results, pitcher_info = self.sim_engine.simulate_game_vectorized(away_team, home_team, sim_count)
-        
-        # Calculate statistics (vectorized)
-        away_scores = [r.away_score for r in results]
-        home_scores = [r.home_score for r in results]
-        total_runs = [r.total_runs for r in results]
-        home_wins = sum(r.home_wins for r in results)
+        convergence = None
+        if mode == 'analytic':
+            histogram, pitcher_info = self.sim_engine.analytic_game_histogram(away_team, home_team)
+        else:
+            sim_count = self._fit_sim_count(budget, sim_count, game_count=1)
+            sim_start = time.perf_counter()
+            if mode == 'adaptive':
+                histogram, pitcher_info, convergence = self.sim_engine.simulate_slate_adaptive(
+                    [(away_team, home_team)], sim_count, game_date, tolerance)[0]
+            elif mode == 'innings':
+                histogram, pitcher_info = self.sim_engine.simulate_slate_innings(
+                    [(away_team, home_team)], sim_count, game_date)[0]
+            else:
+                # Run ultra-fast simulations, reduced to a joint score histogram
+                histogram, pitcher_info = self.sim_engine.simulate_game_histogram(
+                    away_team, home_team, sim_count, game_date, variance_reduction=variance_reduction,
+                    variate_offset=variate_offset)
+            self._record_sim_cost((time.perf_counter() - sim_start) * 1000, int(histogram.sim_count))
+        
+        prediction = self._build_prediction(away_team, home_team, histogram, pitcher_info,
+                                            game_date, start_time, mode, budget)
+        if convergence:
+            prediction['meta'].update(convergence)
+        return prediction
+    
+    def _validate_mode(self, mode: str, variance_reduction: Optional[str]):
+        """Reject unknown modes and unsupported mode/variance-reduction combinations"""
+        if mode not in PREDICTION_MODES:
+            raise ValueError(f"Unknown prediction mode: {mode}")
+        if variance_reduction and variance_reduction not in VARIANCE_REDUCTION_METHODS:
+            raise ValueError(f"Unknown variance reduction method: {variance_reduction}")
+        if variance_reduction and mode in ('adaptive', 'innings'):
+            raise ValueError(f"Variance reduction is not supported in {mode} mode")
+    
+    def _fit_sim_count(self, budget: PredictionBudget, sim_count: int, game_count: int) -> int:
+        """Scale the per-game sim count so simulation plus line lookups fit the deadline"""
+        if budget.deadline_ms is None or game_count == 0:
+            return sim_count
+        reserve_ms = self.stage_costs_ms['betting_lines'] * game_count
+        return budget.fit_sim_count(sim_count, self.sim_cost_ms * game_count, reserve_ms)
+    
+    def get_slate_predictions(self, games: List[Tuple[str, str]], sim_count: int = 1500,
+                              game_date: str = None, mode: str = 'simulation',
+                              variance_reduction: str = None,
+                              tolerance: Dict[str, float] = None,
+                              deadline_ms: Optional[float] = None,
+                              max_exposure: float = PORTFOLIO_MAX_EXPOSURE) -> List[Dict]:
+        """
+        Generate predictions for a whole slate with one batched simulation
+        Historical games are served from the cache; the rest share a single vectorized draw
+        deadline_ms bounds the whole slate (tail latency under load)
+        Simulated games' recommendations priced against real book lines also get simultaneous Kelly
+        stakes (portfolio_bet_size), with the slate's total stake capped at max_exposure of bankroll
+        """
+        self._validate_mode(mode, variance_reduction)
         
-        # Fast statistics
-        avg_away = np.mean(away_scores)
-        avg_home = np.mean(home_scores)
-        avg_total = np.mean(total_runs)
-        home_win_prob = home_wins / sim_count
-        away_win_prob = 1 - home_win_prob
+        start_time = datetime.now()
+        # One resolved date keys both the simulation and the portfolio scenarios (reproducible slates)
+        sim_date = game_date or start_time.strftime('%Y-%m-%d')
+        budget = PredictionBudget(deadline_ms)
+        predictions = [None] * len(games)
         
-        # Confidence intervals (fast percentile calculation)
-        home_ci = (np.percentile(home_scores, 10), np.percentile(home_scores, 90))
-        away_ci = (np.percentile(away_scores, 10), np.percentile(away_scores, 90))
-        total_ci = (np.percentile(total_runs, 10), np.percentile(total_runs, 90))
+        # Historical lookups first (same behaviour as get_fast_prediction)
+        if game_date and self._is_historical_date(game_date):
+            self._auto_update_historical_results_if_needed(game_date, budget)
+            for i, (away_team, home_team) in enumerate(games):
+                predictions[i] = self._get_cached_historical_prediction(away_team, home_team, game_date)
         
-        # Get real betting lines (with fallback to sample lines)
-        betting_lines = self._get_real_or_sample_lines(away_team, home_team, home_win_prob, game_date or datetime.now().strftime('%Y-%m-%d'))
+        pending = [i for i, prediction in enumerate(predictions) if prediction is None]
+        if mode == 'analytic':
+            slate_results = [self.sim_engine.analytic_game_histogram(*games[i]) + ({},) for i in pending]
+        else:
+            sim_count = self._fit_sim_count(budget, sim_count, game_count=len(pending))
+            sim_start = time.perf_counter()
+            if mode == 'adaptive':
+                slate_results = self.sim_engine.simulate_slate_adaptive([games[i] for i in pending], sim_count,
+                                                                        sim_date, tolerance)
+            elif mode == 'innings':
+                slate_results = [result + ({},) for result in self.sim_engine.simulate_slate_innings(
+                    [games[i] for i in pending], sim_count, sim_date)]
+            else:
+                slate_results = [result + ({},) for result in self.sim_engine.simulate_slate(
+                    [games[i] for i in pending], sim_count, sim_date, variance_reduction=variance_reduction)]
+            self._record_sim_cost((time.perf_counter() - sim_start) * 1000,
+                                  sum(int(result[0].sim_count) for result in slate_results))
+        
+        # Lines per game, then one vectorized value scan over the whole slate
+        slate_lines = [self._prediction_lines(*games[i], result[0].home_win_prob(), game_date, budget)
+                       for i, result in zip(pending, slate_results)]
+        slate_recs = self._batch_recommendations([result[0] for result in slate_results], slate_lines)
+        
+        for slot, (i, (histogram, pitcher_info, convergence)) in enumerate(zip(pending, slate_results)):
+            away_team, home_team = games[i]
+            predictions[i] = self._build_prediction(away_team, home_team, histogram, pitcher_info,
+                                                    game_date, start_time, mode, budget,
+                                                    betting_lines=slate_lines[slot],
+                                                    recommendations=slate_recs[slot])
+            predictions[i]['meta'].update(convergence, slate_size=len(pending))
+        
+        # Size every bet with a real book price together (bets on one game share simulated outcomes);
+        # sample lines were never offered, so their recommendations get no stake
+        slate_recs = [predictions[i]['recommendations'] if lines.get('lines_source') == 'feed' else []
+                      for i, lines in zip(pending, slate_lines)]
+        portfolio_rng = self.sim_engine.make_rng('portfolio', sim_date, *(f"{games[i][0]} @ {games[i][1]}" for i in pending))
+        stakes, portfolio = self.betting_analyzer.size_portfolio([result[0] for result in slate_results], slate_recs,
+                                                                 portfolio_rng, max_exposure)
+        for i, game_recs, game_stakes in zip(pending, slate_recs, stakes):
+            for rec, stake in zip(game_recs, game_stakes):
+                rec['portfolio_bet_size'] = round(stake * 100, 1)
+            predictions[i]['meta']['portfolio_exposure'] = round(portfolio['exposure'] * 100, 1)
+        
+        return predictions
+    
+    def get_starter_swap_predictions(self, away_team: str, home_team: str,
+                                     away_starters: List[str] = None, home_starters: List[str] = None,
+                                     sim_count: int = 2000, game_date: str = None) -> List[Dict]:
+        """
+        Predictions for every away x home candidate starter combination (away-major order)
+        A side left as None keeps its projected starter; sim_engine.get_team_rotation(team)
+        gives a team's rotation from pitcher_stats. Every combination comes from one batched draw.
+        """
+        start_time = datetime.now()
+        projected_away, projected_home = self.sim_engine.get_matchup_starters(away_team, home_team)
+        away_starters = away_starters or [projected_away]
+        home_starters = home_starters or [projected_home]
+        
+        sim_start = time.perf_counter()
+        swap_results = self.sim_engine.simulate_starter_swaps(away_team, home_team, away_starters,
+                                                              home_starters, sim_count, game_date)
+        self._record_sim_cost((time.perf_counter() - sim_start) * 1000, sim_count * len(swap_results))
+        
+        # The matchup's lines are fetched once (sample-line fallback keyed on the projected combination)
+        # and every combination is scanned against them in one batch
+        combinations = [(away, home) for away in away_starters for home in home_starters]
+        lines_slot = combinations.index((projected_away, projected_home)) \
+            if (projected_away, projected_home) in combinations else 0
+        budget = PredictionBudget()
+        betting_lines = self._prediction_lines(away_team, home_team, swap_results[lines_slot][0].home_win_prob(),
+                                               game_date, budget)
+        swap_recs = self._batch_recommendations([histogram for histogram, _ in swap_results],
+                                                [betting_lines] * len(swap_results))
+        
+        predictions = []
+        for (histogram, pitcher_info), recommendations in zip(swap_results, swap_recs):
+            prediction = self._build_prediction(away_team, home_team, histogram, pitcher_info,
+                                                game_date, start_time, budget=budget,
+                                                betting_lines=dict(betting_lines), recommendations=recommendations)
+            prediction['meta'].update(starter_swap=True, swap_combinations=len(swap_results))
+            predictions.append(prediction)
+        return predictions
+    
+    def _build_prediction(self, away_team: str, home_team: str, histogram: JointScoreHistogram,
+                          pitcher_info: Dict, game_date: Optional[str],
+                          start_time: datetime, mode: str = 'simulation',
+                          budget: PredictionBudget = None, betting_lines: Dict = None,
+                          recommendations: List[Dict] = None) -> Dict:
+        """
+        Turn a simulated score histogram into the full prediction response
+        Slates pass in their lines and batch-analyzed recommendations
+        """
+        budget = budget or PredictionBudget()
+        # Fast statistics - O(625) over the histogram, no sorting of sim arrays
+        avg_away = histogram.mean_away()
+        avg_home = histogram.mean_home()
+        avg_total = histogram.mean_total()
+        home_win_prob = histogram.home_win_prob()
+        away_win_prob = 1 - home_win_prob
         
-        # Fast betting analysis
-        ml_recs = self.betting_analyzer.analyze_moneyline_value(
-            home_win_prob, away_win_prob,
-            betting_lines['home_ml'], betting_lines['away_ml']
-        )
+        # Confidence intervals (exact 10/90 percentiles from the marginal counts)
+        home_ci = histogram.home_range()
+        away_ci = histogram.away_range()
+        total_ci = histogram.total_runs_range()
         
-        total_recs = self.betting_analyzer.analyze_total_value(
-            avg_total, betting_lines['total_line'],
-            betting_lines['over_odds'], betting_lines['under_odds']
-        )
+        if betting_lines is None:
+            betting_lines = self._prediction_lines(away_team, home_team, home_win_prob, game_date, budget)
         
-        # Combine recommendations
-        all_recommendations = ml_recs + total_recs
+        if recommendations is None:
+            # Fast betting analysis
+            ml_recs = self.betting_analyzer.analyze_moneyline_value(
+                home_win_prob, away_win_prob,
+                betting_lines['home_ml'], betting_lines['away_ml']
+            )
+            
+            # Priced from the simulated total distribution (pushes on whole lines)
+            over_prob, under_prob, _ = histogram.total_line_probs([betting_lines['total_line']])
+            total_recs = self.betting_analyzer.analyze_total_value(
+                avg_total, betting_lines['total_line'],
+                betting_lines['over_odds'], betting_lines['under_odds'],
+                float(over_prob[0]), float(under_prob[0])
+            )
+            
+            # Run line covers from the simulated margin (a slate of one)
+            spread_recs = self._run_line_recommendations([histogram], [betting_lines])[0]
+            
+            # Combine recommendations
+            recommendations = ml_recs + total_recs + spread_recs
+        # Point each main-market bet at the book holding the best price
+        for rec in recommendations:
+            line_key = self.RECOMMENDATION_LINE_KEYS.get((rec['type'], rec['side']))
+            if line_key in betting_lines.get('best_books', {}):
+                rec['book'] = betting_lines['best_books'][line_key]
+                rec['fair_odds'] = betting_lines['fair_odds'][line_key]
+        all_recommendations = (recommendations + self._alt_total_recommendations(histogram, avg_total, betting_lines)
+                               + self._alt_spread_recommendations(histogram, betting_lines))
         
         # Calculate execution time
         execution_time = (datetime.now() - start_time).total_seconds() * 1000
         
-        return {
+        meta = {
+            'simulations_run': 0 if histogram.exact else int(histogram.sim_count),
+            'mode': mode,
+            'execution_time_ms': round(execution_time, 1),
+            'recommendations_found': len(all_recommendations),
+            'timestamp': datetime.now().isoformat()
+        }
+        if budget.deadline_ms is not None:
+            meta['deadline_ms'] = budget.deadline_ms
+            meta['degraded_stages'] = list(budget.degraded_stages)
+        if histogram.variate_offset is not None:
+            meta['variate_offset'] = int(histogram.variate_offset)
+        if histogram.estimates:
+            meta['variance_reduction'] = histogram.estimates['variance_reduction']
+            meta['effective_sample_size'] = histogram.estimates['effective_sample_size']
+        
+        prediction = {
             'away_team': away_team,
             'home_team': home_team,
             'predictions': {
@@ -947,18 +2737,96 @@ class FastPredictionEngine:
                 'home_score_range': (round(home_ci[0], 1), round(home_ci[1], 1)),
                 'away_score_range': (round(away_ci[0], 1), round(away_ci[1], 1)),
                 'total_runs_range': (round(total_ci[0], 1), round(total_ci[1], 1)),
-                'confidence': round(90 - np.std(total_runs) * 10, 1)
+                'confidence': round(90 - histogram.std_total() * 10, 1)
             },
             'betting_lines': betting_lines,
             'recommendations': all_recommendations,
             'pitcher_quality': pitcher_info,
-            'meta': {
-                'simulations_run': sim_count,
-                'execution_time_ms': round(execution_time, 1),
-                'recommendations_found': len(all_recommendations),
-                'timestamp': datetime.now().isoformat()
-            }
+            'meta': meta
         }
+        prediction['alt_totals'] = self.betting_analyzer.alt_totals_ladder(histogram)
+        if betting_lines.get('spread_source') == 'feed':
+            prediction['alt_spreads'] = self.betting_analyzer.alt_spreads_ladder(histogram)
+        if histogram.inning_markets:
+            prediction['inning_markets'] = histogram.inning_markets.summary()
+        return prediction
+    
+    def _alt_total_recommendations(self, histogram: JointScoreHistogram, predicted_total: float,
+                                   betting_lines: Dict) -> List[Dict]:
+        """
+        Scan posted alternate totals ({'line', 'over_odds', 'under_odds'} entries in
+        betting_lines['alt_totals']) in one batch against the same simulated distribution
+        """
+        alt_lines = betting_lines.get('alt_totals') or []
+        if not alt_lines:
+            return []
+        lines = [alt['line'] for alt in alt_lines]
+        over, under, _ = histogram.total_line_probs(lines)
+        alt_recs = self.betting_analyzer.analyze_total_batch(
+            [predicted_total] * len(lines), lines, [alt['over_odds'] for alt in alt_lines],
+            [alt['under_odds'] for alt in alt_lines], over, under)
+        return [dict(rec, type='alt_total') for line_recs in alt_recs for rec in line_recs]
+    
+    def _batch_recommendations(self, histograms: List[JointScoreHistogram],
+                               slate_lines: List[Dict]) -> List[List[Dict]]:
+        """Moneyline, total and run line value for every histogram in one vectorized scan per market"""
+        home_win_probs = [histogram.home_win_prob() for histogram in histograms]
+        moneyline_recs = self.betting_analyzer.analyze_moneyline_batch(
+            home_win_probs, [1 - p for p in home_win_probs],
+            [lines['home_ml'] for lines in slate_lines], [lines['away_ml'] for lines in slate_lines])
+        main_total_probs = [histogram.total_line_probs([lines['total_line']])
+                            for histogram, lines in zip(histograms, slate_lines)]
+        total_recs = self.betting_analyzer.analyze_total_batch(
+            [histogram.mean_total() for histogram in histograms], [lines['total_line'] for lines in slate_lines],
+            [lines['over_odds'] for lines in slate_lines], [lines['under_odds'] for lines in slate_lines],
+            [float(probs[0][0]) for probs in main_total_probs], [float(probs[1][0]) for probs in main_total_probs])
+        spread_recs = self._run_line_recommendations(histograms, slate_lines)
+        return [ml + total + spread for ml, total, spread in zip(moneyline_recs, total_recs, spread_recs)]
+    
+    def _run_line_recommendations(self, histograms: List[JointScoreHistogram],
+                                  slate_lines: List[Dict]) -> List[List[Dict]]:
+        """
+        Run line value per game, in one batch over the games whose run line came from a real feed
+        Synthesized spreads (spread_source 'default') were never offered, so they are not priced
+        """
+        priced = [slot for slot, lines in enumerate(slate_lines) if lines.get('spread_source') == 'feed']
+        recommendations = [[] for _ in slate_lines]
+        if not priced:
+            return recommendations
+        home_spreads = [slate_lines[slot]['spread_home'] for slot in priced]
+        cover_probs = [histograms[slot].spread_cover_probs([spread]) for slot, spread in zip(priced, home_spreads)]
+        priced_recs = self.betting_analyzer.analyze_spread_batch(
+            home_spreads, [float(probs[0][0]) for probs in cover_probs], [float(probs[1][0]) for probs in cover_probs],
+            [slate_lines[slot]['spread_odds'] for slot in priced],
+            [slate_lines[slot].get('spread_away_odds', slate_lines[slot]['spread_odds']) for slot in priced])
+        for slot, game_recs in zip(priced, priced_recs):
+            recommendations[slot] = game_recs
+        return recommendations
+    
+    def _alt_spread_recommendations(self, histogram: JointScoreHistogram, betting_lines: Dict) -> List[Dict]:
+        """
+        Scan posted alternate run lines ({'home_spread', 'home_odds', 'away_odds'} entries in
+        betting_lines['alt_spreads']) in one batch against the simulated run differential
+        """
+        alt_lines = betting_lines.get('alt_spreads') or []
+        if not alt_lines or betting_lines.get('spread_source') != 'feed':
+            return []
+        home_spreads = [alt['home_spread'] for alt in alt_lines]
+        home, away, _ = histogram.spread_cover_probs(home_spreads)
+        alt_recs = self.betting_analyzer.analyze_spread_batch(
+            home_spreads, home, away, [alt['home_odds'] for alt in alt_lines], [alt['away_odds'] for alt in alt_lines])
+        return [dict(rec, type='alt_run_line') for line_recs in alt_recs for rec in line_recs]
+    
+    def _prediction_lines(self, away_team: str, home_team: str, home_win_prob: float,
+                          game_date: Optional[str], budget: PredictionBudget) -> Dict:
+        """Real betting lines (with fallback to sample lines, or straight to them when out of time)"""
+        lines_date = game_date or datetime.now().strftime('%Y-%m-%d')
+        if budget.allows('betting_lines', self.stage_costs_ms['betting_lines']):
+            stage_start = time.perf_counter()
+            betting_lines = self._get_real_or_sample_lines(away_team, home_team, home_win_prob, lines_date)
+            self._record_stage_cost('betting_lines', (time.perf_counter() - stage_start) * 1000)
+            return betting_lines
+        return self._get_sample_lines(away_team, home_team, home_win_prob, lines_date)
     
     def get_todays_real_games(self, game_date: str = None) -> List[Tuple[str, str]]:
         """Get real games from ProjectedStarters.json for specific date or today"""
@@ -986,8 +2854,8 @@ class FastPredictionEngine:
                             home_team = game_data['home_team']
                             
                             # Convert full team names to short names for consistency
-                            away_short = self._convert_to_short_name(away_team)
-                            home_short = self._convert_to_short_name(home_team)
+                            away_short = to_short_name(away_team)
+                            home_short = to_short_name(home_team)
                             
                             real_games.append((away_short, home_short))
                 else:
@@ -1000,8 +2868,8 @@ class FastPredictionEngine:
                                     home_team = game_data['home_team']
                                     
                                     # Convert full team names to short names for consistency
-                                    away_short = self._convert_to_short_name(away_team)
-                                    home_short = self._convert_to_short_name(home_team)
+                                    away_short = to_short_name(away_team)
+                                    home_short = to_short_name(home_team)
                                     
                                     real_games.append((away_short, home_short))
                     
@@ -1023,43 +2891,8 @@ class FastPredictionEngine:
         # Return empty list if no real games found - no test games
         return real_games[:15]  # Limit to first 15 games for performance
     
-    def _convert_to_short_name(self, full_name: str) -> str:
-        """Convert full team names back to short names"""
-        name_mapping = {
-            'Los Angeles Angels': 'Angels',
-            'Houston Astros': 'Astros', 
-            'Oakland Athletics': 'Athletics',
-            'Toronto Blue Jays': 'Blue Jays',
-            'Cleveland Guardians': 'Guardians',
-            'Seattle Mariners': 'Mariners',
-            'Baltimore Orioles': 'Orioles',
-            'Texas Rangers': 'Rangers',
-            'Tampa Bay Rays': 'Rays',
-            'Boston Red Sox': 'Red Sox',
-            'Kansas City Royals': 'Royals',
-            'Detroit Tigers': 'Tigers',
-            'Minnesota Twins': 'Twins',
-            'Chicago White Sox': 'White Sox',
-            'New York Yankees': 'Yankees',
-            'Atlanta Braves': 'Braves',
-            'Milwaukee Brewers': 'Brewers',
-            'St. Louis Cardinals': 'Cardinals',
-            'Chicago Cubs': 'Cubs',
-            'Arizona Diamondbacks': 'Diamondbacks',
-            'Los Angeles Dodgers': 'Dodgers',
-            'San Francisco Giants': 'Giants',
-            'Miami Marlins': 'Marlins',
-            'New York Mets': 'Mets',
-            'Washington Nationals': 'Nationals',
-            'San Diego Padres': 'Padres',
-            'Philadelphia Phillies': 'Phillies',
-            'Pittsburgh Pirates': 'Pirates',
-            'Cincinnati Reds': 'Reds',
-            'Colorado Rockies': 'Rockies'
-        }
-        return name_mapping.get(full_name, full_name)
-    
-    def _get_sample_lines(self, away_team: str, home_team: str, home_win_prob: float) -> Dict:
+    def _get_sample_lines(self, away_team: str, home_team: str, home_win_prob: float,
+                          game_date: str = None) -> Dict:
         """Generate realistic betting lines based on win probability"""
         # Convert win prob to moneyline odds
         if home_win_prob > 0.5:
@@ -1070,7 +2903,9 @@ class FastPredictionEngine:
             away_ml = int(-100 * home_win_prob / (1 - home_win_prob))
         
         # Sample total line (can be improved with real data)
-        total_line = 8.5 + random.uniform(-1.0, 1.0)
+        # Stable per-game generator so sample lines don't change between requests or workers
+        rng = self.sim_engine.make_rng('sample_lines', game_date, f"{away_team} @ {home_team}")
+        total_line = 8.5 + rng.uniform(-1.0, 1.0)
         
         return {
             'home_ml': home_ml,
@@ -1079,47 +2914,16 @@ class FastPredictionEngine:
             'over_odds': -110,
             'under_odds': -110,
             'spread_home': -1.5 if home_win_prob > 0.55 else 1.5,
-            'spread_odds': -110
+            'spread_odds': -110,
+            'spread_away_odds': -110,
+            'spread_source': 'default',  # Synthesized, not offered - never priced as a bet
+            'lines_source': 'sample'
         }
     
     def _get_real_or_sample_lines(self, away_team: str, home_team: str, home_win_prob: float, game_date: str) -> Dict:
         """Get real betting lines if available, otherwise generate sample lines"""
         today = datetime.now().strftime('%Y-%m-%d')
         
-        # Team name mapping from short to full names (as used in betting lines)
-        team_full_names = {
-            'Angels': 'Los Angeles Angels',
-            'Astros': 'Houston Astros', 
-            'Athletics': 'Oakland Athletics',
-            'Blue Jays': 'Toronto Blue Jays',
-            'Guardians': 'Cleveland Guardians',
-            'Mariners': 'Seattle Mariners',
-            'Orioles': 'Baltimore Orioles',
-            'Rangers': 'Texas Rangers',
-            'Rays': 'Tampa Bay Rays',
-            'Red Sox': 'Boston Red Sox',
-            'Royals': 'Kansas City Royals',
-            'Tigers': 'Detroit Tigers',
-            'Twins': 'Minnesota Twins',
-            'White Sox': 'Chicago White Sox',
-            'Yankees': 'New York Yankees',
-            'Braves': 'Atlanta Braves',
-            'Brewers': 'Milwaukee Brewers',
-            'Cardinals': 'St. Louis Cardinals',
-            'Cubs': 'Chicago Cubs',
-            'Diamondbacks': 'Arizona Diamondbacks',
-            'Dodgers': 'Los Angeles Dodgers',
-            'Giants': 'San Francisco Giants',
-            'Marlins': 'Miami Marlins',
-            'Mets': 'New York Mets',
-            'Nationals': 'Washington Nationals',
-            'Padres': 'San Diego Padres',
-            'Phillies': 'Philadelphia Phillies',
-            'Pirates': 'Pittsburgh Pirates',
-            'Reds': 'Cincinnati Reds',
-            'Rockies': 'Colorado Rockies'
-        }
-        
         try:
             print(f"🔍 Betting lines lookup: {away_team} @ {home_team} on {game_date}")
             print(f"📅 Today: {today}, Game date: {game_date}, Is current/future: {game_date >= today}")
@@ -1132,15 +2936,9 @@ class FastPredictionEngine:
                     
                     print(f"📊 Available betting dates: {list(betting_data.keys())}")
                     
-                    # Try to map to full team names for betting lines lookup
-                    away_full = team_full_names.get(away_team, away_team)
-                    home_full = team_full_names.get(home_team, home_team)
-                    
-                    # Handle special cases where ProjectedStarters has inconsistent naming
-                    if away_team == "Athletics":
-                        away_full = "Oakland Athletics"
-                    if home_team == "Athletics":
-                        home_full = "Oakland Athletics"
+                    # Map to full team names for betting lines lookup
+                    away_full = to_full_name(away_team)
+                    home_full = to_full_name(home_team)
                     
                     print(f"🏷️ Team mapping: {away_team} → {away_full}, {home_team} → {home_full}")
                     
@@ -1180,33 +2978,14 @@ class FastPredictionEngine:
         
         # Fallback to sample lines
         print(f"📊 Using sample betting lines for {away_team} @ {home_team}")
-        return self._get_sample_lines(away_team, home_team, home_win_prob)
+        return self._get_sample_lines(away_team, home_team, home_win_prob, game_date)
     
     def _convert_real_lines_format(self, real_lines: Dict, away_team: str, home_team: str, home_win_prob: float) -> Optional[Dict]:
         """Convert real betting lines to our internal format"""
         try:
             # Get full team names for moneyline lookup (betting lines use full names)
-            team_full_names = {
-                'Angels': 'Los Angeles Angels', 'Astros': 'Houston Astros', 'Athletics': 'Oakland Athletics',
-                'Blue Jays': 'Toronto Blue Jays', 'Guardians': 'Cleveland Guardians', 'Mariners': 'Seattle Mariners',
-                'Orioles': 'Baltimore Orioles', 'Rangers': 'Texas Rangers', 'Rays': 'Tampa Bay Rays',
-                'Red Sox': 'Boston Red Sox', 'Royals': 'Kansas City Royals', 'Tigers': 'Detroit Tigers',
-                'Twins': 'Minnesota Twins', 'White Sox': 'Chicago White Sox', 'Yankees': 'New York Yankees',
-                'Braves': 'Atlanta Braves', 'Brewers': 'Milwaukee Brewers', 'Cardinals': 'St. Louis Cardinals',
-                'Cubs': 'Chicago Cubs', 'Diamondbacks': 'Arizona Diamondbacks', 'Dodgers': 'Los Angeles Dodgers',
-                'Giants': 'San Francisco Giants', 'Marlins': 'Miami Marlins', 'Mets': 'New York Mets',
-                'Nationals': 'Washington Nationals', 'Padres': 'San Diego Padres', 'Phillies': 'Philadelphia Phillies',
-                'Pirates': 'Pittsburgh Pirates', 'Reds': 'Cincinnati Reds', 'Rockies': 'Colorado Rockies'
-            }
-            
-            away_full = team_full_names.get(away_team, away_team)
-            home_full = team_full_names.get(home_team, home_team)
-            
-            # Handle special cases where ProjectedStarters has inconsistent naming
-            if away_team == "Athletics":
-                away_full = "Oakland Athletics"
-            if home_team == "Athletics":
-                home_full = "Oakland Athletics"
+            away_full = to_full_name(away_team)
+            home_full = to_full_name(home_team)
             
             lines = {
                 'home_ml': None,
@@ -1215,7 +2994,10 @@ class FastPredictionEngine:
                 'over_odds': -110,
                 'under_odds': -110,
                 'spread_home': -1.5 if home_win_prob > 0.55 else 1.5,
-                'spread_odds': -110
+                'spread_odds': -110,
+                'spread_away_odds': -110,
+                'spread_source': 'default',
+                'lines_source': 'feed'
             }
             
             # Extract moneyline using full team names
@@ -1246,6 +3028,20 @@ class FastPredictionEngine:
                         if rl.get('team') == home_full:  # Use full name for runline too
                             lines['spread_home'] = rl.get('point', lines['spread_home'])
                             lines['spread_odds'] = rl.get('price', -110)
+                            lines['spread_source'] = 'feed'
+                        elif rl.get('team') == away_full:
+                            lines['spread_away_odds'] = rl.get('price', -110)
+            
+            # Prices above are the best across bookmakers; keep where they are and the no-vig fair odds
+            market = real_lines.get('market') or {}
+            for market_key, line_keys in self.MARKET_LINE_KEYS.items():
+                summary = market.get(market_key)
+                if summary:
+                    lines.setdefault('best_books', {}).update(zip(line_keys, summary['best_book']))
+                    lines.setdefault('fair_odds', {}).update(zip(line_keys, summary['fair']))
+                    lines.setdefault('consensus_odds', {}).update(zip(line_keys, summary['consensus']))
+            if market.get('bookmakers'):
+                lines['bookmakers'] = len(market['bookmakers'])
             
             # Return lines if we have at least moneyline data
             if lines['home_ml'] is not None and lines['away_ml'] is not None:
@@ -258,6 +258,20 @@ except ImportError as e:
 
 app = Flask(__name__)
 
+# Per-route latency budgets in ms (None = unbounded); override per request with ?deadline_ms=
+# Historical result updates that do not fit the budget run in the background, not inline
+ROUTE_DEADLINES_MS = {
+    'real-games-predictions': 1000,
+    'games-predictions': 1000
+}
+
+def get_route_deadline_ms(route_name: str):
+    """Deadline for a route, overridable with ?deadline_ms= (0 disables it)"""
+    deadline_ms = request.args.get('deadline_ms', type=float)
+    if deadline_ms is None:
+        return ROUTE_DEADLINES_MS.get(route_name)
+    return deadline_ms if deadline_ms > 0 else None
+
 # Initialize betting lines auto-updater
 def initialize_betting_lines():
     """Initialize and run betting lines auto-updater on startup"""
@@ -992,7 +1006,7 @@ HTML_TEMPLATE = """
                     <div style="margin-top: 10px; padding: 10px; background: rgba(40, 167, 69, 0.2); border-radius: 6px;">
                         <div style="font-weight: bold; color: #28a745; margin-bottom: 5px;">📊 Run Line (1.5)</div>
                         <div style="font-size: 0.9em; display: grid; grid-template-columns: 1fr 1fr; gap: 10px;">
-                            <div>${createTeamLogo(data.away_team)} ${data.betting_lines.spread_home > 0 ? '+1.5' : '-1.5'}: ${data.betting_lines.spread_odds || '-110'}</div>
+                            <div>${createTeamLogo(data.away_team)} ${data.betting_lines.spread_home > 0 ? '+1.5' : '-1.5'}: ${data.betting_lines.spread_away_odds || data.betting_lines.spread_odds || '-110'}</div>
                             <div>${createTeamLogo(data.home_team)} ${data.betting_lines.spread_home < 0 ? '+1.5' : '-1.5'}: ${data.betting_lines.spread_odds || '-110'}</div>
                         </div>
                     </div>
@@ -1250,12 +1264,11 @@ def get_real_games_predictions():
             else:
                 games_source = 'ProjectedStarters.json - Real MLB games'
             
-            predictions = []
             start_time = datetime.now()
             
-            for away, home in real_games:
-                prediction = engine.get_fast_prediction(away, home, sim_count=1500)
-                predictions.append(prediction)
+            # Whole slate in one batched simulation
+            predictions = engine.get_slate_predictions(real_games, sim_count=1500,
+                                                       deadline_ms=get_route_deadline_ms('real-games-predictions'))
             
             total_time = (datetime.now() - start_time).total_seconds() * 1000
             
@@ -1292,13 +1305,11 @@ def get_games_predictions():
                     'suggestion': 'August 8, 2025 has complete accuracy validation data with 15 games showing predicted vs actual results.'
                 })
             
-            predictions = []
             start_time = datetime.now()
             
-            for away, home in real_games:
-                # Pass the game_date to enable historical lookup
-                prediction = engine.get_fast_prediction(away, home, sim_count=1500, game_date=game_date)
-                predictions.append(prediction)
+            # Pass the game_date to enable historical lookup; live games share one batched simulation
+            predictions = engine.get_slate_predictions(real_games, sim_count=1500, game_date=game_date,
+                                                       deadline_ms=get_route_deadline_ms('games-predictions'))
             
             total_time = (datetime.now() - start_time).total_seconds() * 1000
             
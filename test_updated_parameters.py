@@ -4,7 +4,8 @@ Test Updated Model Parameters
 Quick test of the updated model on a few sample games
 """
 
-from ultra_fast_engine import FastPredictionEngine
+from concurrent.futures import ProcessPoolExecutor
+from ultra_fast_engine import FastPredictionEngine, PARALLEL_TASK_SIMS
 from model_performance_analyzer import ModelPerformanceAnalyzer
 
 def test_updated_parameters():
@@ -12,20 +13,35 @@ def test_updated_parameters():
     print("🧪 Testing updated model parameters...")
     print("📊 Current settings: base_runs=4.3, chaos_factor=0.42")
     
-    engine = FastPredictionEngine()
-    
     # Test a few real games from our historical data
     test_games = [
         ("Astros", "Yankees", "2025-08-09"),
         ("Red Sox", "Padres", "2025-08-08"),
         ("Cubs", "Cardinals", "2025-08-09")
     ]
+    sim_count = 2000
+    
+    # A process pool only pays off once the job outgrows one executor task
+    executor = ProcessPoolExecutor() if len(test_games) * sim_count > PARALLEL_TASK_SIMS else None
+    engine = FastPredictionEngine(executor=executor)
     
     print(f"\\n🎯 Testing {len(test_games)} sample games...")
     
+    # One batched request per date (games spread over the executor when one is plugged in)
+    predictions = {}
+    for date in sorted({date for _, _, date in test_games}):
+        date_games = [(away, home) for away, home, game_date in test_games if game_date == date]
+        try:
+            for game, prediction in zip(date_games, engine.get_slate_predictions(date_games, sim_count=sim_count, game_date=date)):
+                predictions[game + (date,)] = prediction
+        except Exception as e:
+            print(f"\\n❌ Error testing games on {date}: {e}")
+    if executor:
+        executor.shutdown()
+    
     for away, home, date in test_games:
         try:
-            prediction = engine.get_fast_prediction(away, home, game_date=date)
+            prediction = predictions.get((away, home, date))
             
             if prediction and 'predictions' in prediction:
                 pred_away = prediction['predictions']['predicted_away_score']